@@ -255,8 +255,22 @@ def submit(
     help="The recipients of the submission results email as a comma-delimited string",
     required=True,
 )
-def finalize(ctx: click.Context, email_recipients: str) -> None:
+@click.option(
+    "--visibility-timeout",
+    type=int,
+    help=(
+        "The duration (in seconds) that received result messages are hidden from "
+        "subsequent requests; set this above the expected run time for large "
+        "batches. Defaults to the visibility timeout configured for the queue."
+    ),
+    default=None,
+)
+def finalize(
+    ctx: click.Context,
+    email_recipients: str,
+    visibility_timeout: int | None = None,
+) -> None:
     """Analyze ingest results for a given batch."""
     workflow = ctx.obj["workflow"]
-    workflow.finalize_items()
+    workflow.finalize_items(visibility_timeout=visibility_timeout)
     workflow.send_report(step="finalize", email_recipients=email_recipients.split(","))
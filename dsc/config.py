@@ -31,8 +31,10 @@ class Config:
     ]
 
     OPTIONAL_ENV_VARS: Iterable[str] = [
+        "MAX_WORKERS",
         "RETRY_THRESHOLD",
         "S3_BUCKET_SYNC_SOURCE",
+        "SQS_WAIT_TIME_SECONDS",
         "WARNING_ONLY_LOGGERS",
     ]
 
@@ -55,6 +57,10 @@ class Config:
             raise OSError("Env var 'ITEM_SUBMISSIONS_TABLE_NAME' must be defined")
         return value
 
+    @property
+    def max_workers(self) -> int:
+        return int(os.getenv("MAX_WORKERS", "8"))
+
     @property
     def retry_threshold(self) -> int:
         return int(os.getenv("RETRY_THRESHOLD", "20"))
@@ -84,6 +90,10 @@ class Config:
             raise OSError("Env var 'SQS_QUEUE_DSS_INPUT' must be defined")
         return value
 
+    @property
+    def sqs_wait_time_seconds(self) -> int:
+        return int(os.getenv("SQS_WAIT_TIME_SECONDS", "1"))
+
     @property
     def warning_only_loggers(self) -> list:
         if _excluded_loggers := os.getenv("WARNING_ONLY_LOGGERS"):
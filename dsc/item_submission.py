@@ -4,7 +4,7 @@ import json
 import logging
 from collections import defaultdict
 from dataclasses import dataclass, fields
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 
 from botocore.exceptions import ClientError
 from pynamodb.exceptions import DoesNotExist
@@ -20,7 +20,7 @@ from dsc.utils.aws.s3 import S3Client
 from dsc.utils.aws.sqs import SQSClient
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
     from datetime import datetime
 
     from mypy_boto3_sqs.type_defs import SendMessageResultTypeDef
@@ -29,6 +29,38 @@ logger = logging.getLogger(__name__)
 CONFIG = Config()
 
 
+class MetadataFieldMapping(NamedTuple):
+    """A DSpace metadata field mapping resolved from a metadata mapping."""
+
+    field_name: str
+    source_field_name: str
+    delimiter: str | None
+    required: bool
+
+
+def compile_metadata_mapping(metadata_mapping: dict) -> tuple[MetadataFieldMapping, ...]:
+    """Resolve a metadata mapping into a tuple of field mappings.
+
+    The 'item_identifier' entry is dropped and defaults are applied for optional
+    configs, so that these lookups are done once per mapping rather than once
+    per item.
+
+    Args:
+        metadata_mapping: A mapping of DSpace metadata fields to source metadata
+            fields. See ItemSubmission.create_dspace_metadata for the format.
+    """
+    return tuple(
+        MetadataFieldMapping(
+            field_name=field_name,
+            source_field_name=field_mapping["source_field_name"],
+            delimiter=field_mapping.get("delimiter"),
+            required=field_mapping.get("required", False),
+        )
+        for field_name, field_mapping in metadata_mapping.items()
+        if field_name != "item_identifier"
+    )
+
+
 @dataclass
 class ItemSubmission:
     """Domain class that stores both persistence and business logic for item submissions.
@@ -158,16 +190,23 @@ class ItemSubmission:
             if hasattr(item_submission_db, attr):
                 value = getattr(item_submission_db, attr)
                 setattr(item_submission, attr, value)
-        logger.debug(
-            f"Populated record {
-                ITEM_SUBMISSION_LOG_STR.format(
-                    batch_id=item_submission_db.batch_id,
-                    item_identifier=item_submission_db.item_identifier,
-                )
-            }"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Populated record {
+                    ITEM_SUBMISSION_LOG_STR.format(
+                        batch_id=item_submission_db.batch_id,
+                        item_identifier=item_submission_db.item_identifier,
+                    )
+                }"
+            )
         return item_submission
 
+    def _to_db(self) -> ItemSubmissionDB:
+        """Create an instance of ItemSubmissionDB from the persisted attributes."""
+        return ItemSubmissionDB(
+            **{attr: getattr(self, attr) for attr in ItemSubmissionDB.get_attributes()}
+        )
+
     def save(self) -> None:
         """Create a record in DynamoDB from self.
 
@@ -176,9 +215,7 @@ class ItemSubmission:
         record on DynamoDB, which will first check whether an item with the same primary
         keys already exists (and raises an error if one is found).
         """
-        item_submission_db = ItemSubmissionDB(
-            **{attr: getattr(self, attr) for attr in ItemSubmissionDB.get_attributes()}
-        )
+        item_submission_db = self._to_db()
         item_submission_db.create()
 
         logger.info(
@@ -200,9 +237,7 @@ class ItemSubmission:
         NOTE: This method relies on the pynamodb.Model.save method to persist the
         record in DynamoDB, which can overwrite an existing record.
         """
-        item_submission_db = ItemSubmissionDB(
-            **{attr: getattr(self, attr) for attr in ItemSubmissionDB.get_attributes()}
-        )
+        item_submission_db = self._to_db()
         item_submission_db.save()
 
         logger.info(
@@ -214,6 +249,35 @@ class ItemSubmission:
             }"
         )
 
+    @classmethod
+    def batch_upsert_db(cls, item_submissions: Iterable[ItemSubmission]) -> None:
+        """Upsert records in DynamoDB for multiple ItemSubmissions.
+
+        This method relies on the pynamodb.Model.batch_write context manager,
+        which writes records in BatchWriteItem requests of up to 25 records and
+        retries any unprocessed records.
+
+        NOTE: Like ItemSubmission.upsert_db, this method can overwrite existing
+        records. BatchWriteItem does not support condition expressions, so
+        ItemSubmission.save must be used to create new records.
+        """
+        upserted_item_submissions = []
+        with ItemSubmissionDB.batch_write() as batch:
+            for item_submission in item_submissions:
+                batch.save(item_submission._to_db())  # noqa: SLF001
+                upserted_item_submissions.append(item_submission)
+
+        for item_submission in upserted_item_submissions:
+            logger.info(
+                f"Upserted record "
+                f"{
+                    ITEM_SUBMISSION_LOG_STR.format(
+                        batch_id=item_submission.batch_id,
+                        item_identifier=item_submission.item_identifier,
+                    )
+                }"
+            )
+
     def ready_to_submit(self) -> bool:
         """Check if the item submission is ready to be submitted."""
         ready_to_submit = False
@@ -271,15 +335,17 @@ class ItemSubmission:
                     " status unknown, skipping submission"
                 )
             case _:
-                logger.debug(
-                    f"Record "
-                    f"{
-                        ITEM_SUBMISSION_LOG_STR.format(
-                            batch_id=self.batch_id, item_identifier=self.item_identifier
-                        )
-                    } "
-                    "allowed for submission"
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Record "
+                        f"{
+                            ITEM_SUBMISSION_LOG_STR.format(
+                                batch_id=self.batch_id,
+                                item_identifier=self.item_identifier,
+                            )
+                        } "
+                        "allowed for submission"
+                    )
                 ready_to_submit = True
 
         return ready_to_submit
@@ -297,7 +363,8 @@ class ItemSubmission:
         item_metadata: dict,
         s3_bucket: str,
         batch_path: str,
-        metadata_mapping: dict | None = None,
+        metadata_mapping: dict | tuple[MetadataFieldMapping, ...] | None = None,
+        s3_client: S3Client | None = None,
     ) -> None:
         """Prepare DSpace metadata for the item submission."""
         if metadata_mapping:
@@ -307,10 +374,14 @@ class ItemSubmission:
             )
         else:
             self.create_dspace_metadata_without_mapping(item_metadata)
-        self.upload_dspace_metadata(bucket=s3_bucket, prefix=batch_path)
+        self.upload_dspace_metadata(
+            bucket=s3_bucket, prefix=batch_path, s3_client=s3_client
+        )
 
     def create_dspace_metadata(
-        self, item_metadata: dict[str, Any], metadata_mapping: dict
+        self,
+        item_metadata: dict[str, Any],
+        metadata_mapping: dict | tuple[MetadataFieldMapping, ...],
     ) -> None:
         """Create item metadata for DSpace 8.
 
@@ -333,30 +404,32 @@ class ItemSubmission:
         Args:
             item_metadata: Item metadata from which the DSpace metadata will be derived.
             metadata_mapping: A mapping of DSpace metadata fields to source metadata
-            fields.
+            fields, or a mapping already resolved by compile_metadata_mapping.
         """
-        metadata = defaultdict(list)
+        if isinstance(metadata_mapping, dict):
+            metadata_mapping = compile_metadata_mapping(metadata_mapping)
 
-        for field_name, field_mapping in metadata_mapping.items():
-            if field_name != "item_identifier":
-                field_value = item_metadata.get(field_mapping["source_field_name"])
-                if not field_value and field_mapping.get("required", False):
-                    raise ItemMetadataMissingRequiredFieldError(
-                        "Item metadata missing required field: '"
-                        f"{field_mapping['source_field_name']}'"
-                    )
+        metadata = defaultdict(list)
 
-                if field_value:
-                    if isinstance(field_value, list):
-                        field_values = field_value
-                    elif delimiter := field_mapping.get("delimiter"):
-                        field_values = field_value.split(delimiter)
-                    else:
-                        field_values = [field_value]
+        get_field_value = item_metadata.get
+        for field_name, source_field_name, delimiter, required in metadata_mapping:
+            field_value = get_field_value(source_field_name)
+            if not field_value and required:
+                raise ItemMetadataMissingRequiredFieldError(
+                    f"Item metadata missing required field: '{source_field_name}'"
+                )
 
-                    metadata[field_name].extend(
-                        [{"value": value} for value in field_values]
-                    )
+            if field_value:
+                if isinstance(field_value, list):
+                    field_values = field_value
+                elif delimiter and delimiter in field_value:
+                    field_values = field_value.split(delimiter)
+                else:
+                    # single value, no need to split
+                    metadata[field_name].append({"value": field_value})
+                    continue
+
+                metadata[field_name].extend([{"value": value} for value in field_values])
         self.dspace_metadata = dict(metadata)
 
     def create_dspace_metadata_without_mapping(
@@ -408,7 +481,9 @@ class ItemSubmission:
 
         self.dspace_metadata = dict(metadata)
 
-    def upload_dspace_metadata(self, bucket: str, prefix: str) -> None:
+    def upload_dspace_metadata(
+        self, bucket: str, prefix: str, s3_client: S3Client | None = None
+    ) -> None:
         """Upload DSpace metadata to S3 using the specified bucket and keyname.
 
         Args:
@@ -416,9 +491,10 @@ class ItemSubmission:
             prefix: The S3 prefix (or 'folder') in which the 'subfolder' for
                 DSpace metadata is created. In practice, this corresponds with
                 Workflow.batch_path.
-
+            s3_client: S3Client used to upload the file. If not provided, a new
+                client is created.
         """
-        s3_client = S3Client()
+        s3_client = s3_client or S3Client()
         metadata_s3_key = f"{prefix}dspace_metadata/{self.item_identifier}_metadata.json"
         try:
             s3_client.put_file(
@@ -437,7 +513,7 @@ class ItemSubmission:
         logger.info(f"Metadata uploaded to S3: {metadata_s3_uri}")
         self.metadata_s3_uri = metadata_s3_uri
 
-    def send_submission_message(  # noqa: PLR0917
+    def create_submission_message(  # noqa: PLR0917
         self,
         submission_source: str,
         output_queue: str,
@@ -445,8 +521,8 @@ class ItemSubmission:
         operation: Literal["create", "update"] | None = "create",
         collection_handle: str | None = None,
         item_handle: str | None = None,
-    ) -> SendMessageResultTypeDef:
-        """Send a submission message to the DSS input queue.
+    ) -> tuple[dict[str, Any], str]:
+        """Create the attributes and body of a submission message.
 
         Args:
             submission_source: The source for the submission.
@@ -457,11 +533,11 @@ class ItemSubmission:
             Defaults to 'create'.
             collection_handle: The handle for the collection in which an item is created.
             item_handle: The handle of an item to be updated.
+
+        Raises:
+            ValueError: If the metadata S3 URI or bitstream S3 URIs are not set.
         """
-        sqs_client = SQSClient(
-            region=CONFIG.aws_region_name, queue_name=CONFIG.sqs_queue_dss_input
-        )
-        message_attributes = sqs_client.create_dss_message_attributes(
+        message_attributes = SQSClient.create_dss_message_attributes(
             self.item_identifier, submission_source, output_queue
         )
         if not self.metadata_s3_uri or not self.bitstream_s3_uris:
@@ -472,7 +548,7 @@ class ItemSubmission:
             logger.error(message)
             raise ValueError(message)
 
-        message_body = sqs_client.create_dss_message_body(
+        message_body = SQSClient.create_dss_message_body(
             submission_system=submission_system,
             metadata_s3_uri=self.metadata_s3_uri,
             bitstream_s3_uris=self.bitstream_s3_uris,
@@ -480,6 +556,43 @@ class ItemSubmission:
             collection_handle=collection_handle,
             item_handle=item_handle,
         )
+        return message_attributes, message_body
+
+    def send_submission_message(  # noqa: PLR0917
+        self,
+        submission_source: str,
+        output_queue: str,
+        submission_system: str,
+        operation: Literal["create", "update"] | None = "create",
+        collection_handle: str | None = None,
+        item_handle: str | None = None,
+        sqs_client: SQSClient | None = None,
+    ) -> SendMessageResultTypeDef:
+        """Send a submission message to the DSS input queue.
+
+        Args:
+            submission_source: The source for the submission.
+            output_queue: The SQS output queue used for retrieving result messages.
+            submission_system: The system where the submission is uploaded
+            (e.g. DSpace@MIT).
+            operation: The operation to perform for an item, 'create' or 'update'.
+            Defaults to 'create'.
+            collection_handle: The handle for the collection in which an item is created.
+            item_handle: The handle of an item to be updated.
+            sqs_client: SQSClient for the DSS input queue. If not provided, a new
+                client is created.
+        """
+        sqs_client = sqs_client or SQSClient(
+            region=CONFIG.aws_region_name, queue_name=CONFIG.sqs_queue_dss_input
+        )
+        message_attributes, message_body = self.create_submission_message(
+            submission_source=submission_source,
+            output_queue=output_queue,
+            submission_system=submission_system,
+            operation=operation,
+            collection_handle=collection_handle,
+            item_handle=item_handle,
+        )
         try:
             response = sqs_client.send(message_attributes, message_body)
         except ClientError as exception:
@@ -110,8 +110,22 @@ class Report(ABC):
 
         return attachments_list
 
-    def upload_attachments(self, output_location: str) -> None:
-        for filename, buffer in self.prepare_attachments():
+    def upload_attachments(
+        self, output_location: str, attachments: list[tuple] | None = None
+    ) -> None:
+        """Upload attachments to an output location.
+
+        Args:
+            output_location: The S3 URI or local path of the folder where
+                attachments are written.
+            attachments: Attachments previously created by
+                Report.prepare_attachments. If not provided, attachments are
+                prepared by this method.
+        """
+        if attachments is None:
+            attachments = self.prepare_attachments()
+
+        for filename, buffer in attachments:
             file = f"{output_location.removesuffix('/')}/{filename}"
             mode = "wb" if isinstance(buffer, BytesIO) else "w"
             with smart_open.open(file, mode) as f:
@@ -44,7 +44,7 @@ UNIT_VALUES = frozenset(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Metric:
     """A class representing a single metric to be published to CloudWatch."""
 
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import logging
+import re
 import subprocess
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 import boto3
+from botocore.config import Config
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Iterator
@@ -16,8 +18,20 @@ logger = logging.getLogger(__name__)
 class S3Client:
     """A class to perform common S3 operations for this application."""
 
-    def __init__(self) -> None:
-        self.client = boto3.client("s3")
+    def __init__(self, max_pool_connections: int | None = None) -> None:
+        """Initialize S3 client.
+
+        Args:
+            max_pool_connections: The maximum number of connections kept in the
+                client's connection pool. Set this to the number of threads sharing
+                the client; if not provided, the botocore default (10) is used.
+        """
+        config = (
+            Config(max_pool_connections=max_pool_connections)
+            if max_pool_connections
+            else None
+        )
+        self.client = boto3.client("s3", config=config)
 
     def move_file(
         self,
@@ -76,6 +90,25 @@ class S3Client:
         )
         logger.debug(f"File uploaded to S3: {bucket}/{key}")
 
+    def subfolders_iter(self, bucket: str, prefix: str = "") -> Iterator[str]:
+        """Yield the prefixes of the subfolders directly under a prefix.
+
+        Subfolders are listed as common prefixes (using '/' as the delimiter), so
+        the objects stored in them are not listed.
+
+        Args:
+            bucket: S3 bucket name.
+            prefix: The prefix (i.e., folder in S3 bucket) to list subfolders of.
+
+        Yields:
+            Subfolder prefixes, ending with '/'.
+        """
+        paginator = self.client.get_paginator("list_objects_v2")
+        page_iterator = paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter="/")
+        for page in page_iterator:
+            for common_prefix in page.get("CommonPrefixes", []):
+                yield common_prefix["Prefix"]
+
     def files_iter(
         self,
         bucket: str,
@@ -106,26 +139,25 @@ class S3Client:
         paginator = self.client.get_paginator("list_objects_v2")
         page_iterator = paginator.paginate(Bucket=bucket, Prefix=prefix)
 
-        if exclude_prefixes is None:
-            exclude_prefixes = []
+        # match all excluded prefixes in a single pass over each key
+        exclude_pattern = (
+            re.compile("|".join(map(re.escape, exclude_prefixes)))
+            if exclude_prefixes
+            else None
+        )
 
         for page in page_iterator:
             for content in page.get("Contents", []):
-                if content["Key"] == prefix:
+                key = content["Key"]
+                if key == prefix:
                     # skip base folder
                     continue
 
-                if (
-                    content["Key"].endswith(file_type)
-                    and item_identifier in content["Key"]
-                ):
-                    if any(
-                        exclude_prefix in content["Key"]
-                        for exclude_prefix in exclude_prefixes
-                    ):
+                if key.endswith(file_type) and item_identifier in key:
+                    if exclude_pattern and exclude_pattern.search(key):
                         continue
 
-                    yield f"s3://{bucket}/{content['Key']}"
+                    yield f"s3://{bucket}/{key}"
 
 
 def run_aws_cli_sync(
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from boto3 import client
 
@@ -10,9 +10,11 @@ if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Iterator, Mapping
 
     from mypy_boto3_sqs.type_defs import (
+        DeleteMessageBatchRequestEntryTypeDef,
         EmptyResponseMetadataTypeDef,
         MessageAttributeValueTypeDef,
         MessageTypeDef,
+        SendMessageBatchRequestEntryTypeDef,
         SendMessageResultTypeDef,
     )
 
@@ -22,6 +24,12 @@ logger = logging.getLogger(__name__)
 class SQSClient:
     """A class to perform common SQS operations for this application."""
 
+    # maximum number of entries allowed in a single SQS batch request
+    max_batch_entries: ClassVar[int] = 10
+
+    # maximum total size (in bytes) of the messages in a single SQS batch request
+    max_batch_size: ClassVar[int] = 262_144
+
     def __init__(
         self, region: str, queue_name: str, queue_url: str | None = None
     ) -> None:
@@ -119,6 +127,59 @@ class SQSClient:
         logger.debug(f"Deleted message: {message_id}")
         return response
 
+    def delete_batch(self, messages: list[tuple[str, str]]) -> list[str]:
+        """Delete a batch of messages from SQS queue in a single request.
+
+        Entries that fail to delete are retried once, unless the failure was
+        caused by the sender (e.g., an invalid receipt handle).
+
+        Args:
+            messages: A list of up to 10 (message_id, receipt_handle) tuples.
+
+        Returns:
+            A list of message IDs for the messages that failed to delete.
+        """
+        if len(messages) > self.max_batch_entries:
+            raise ValueError(
+                f"Cannot delete more than {self.max_batch_entries} messages "
+                f"in a single request, received {len(messages)}"
+            )
+
+        # batch entry IDs must be unique, so entries are keyed by position
+        # in case the same message was received more than once
+        pending = {str(index): message for index, message in enumerate(messages)}
+        failed_message_ids: list[str] = []
+        for attempt in range(2):
+            entries: list[DeleteMessageBatchRequestEntryTypeDef] = [
+                {"Id": entry_id, "ReceiptHandle": receipt_handle}
+                for entry_id, (_, receipt_handle) in pending.items()
+            ]
+            response = self.client.delete_message_batch(
+                QueueUrl=self.queue_url, Entries=entries
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                for entry in response.get("Successful", []):
+                    logger.debug(f"Deleted message: {pending[entry['Id']][0]}")
+
+            retry = {}
+            for entry in response.get("Failed", []):
+                message_id = pending[entry["Id"]][0]
+                if attempt == 0 and not entry["SenderFault"]:
+                    retry[entry["Id"]] = pending[entry["Id"]]
+                    continue
+                logger.error(
+                    f"Failed to delete message: {message_id} "
+                    f"({entry['Code']}: {entry.get('Message')})"
+                )
+                failed_message_ids.append(message_id)
+
+            if not retry:
+                break
+            logger.warning(f"Retrying deletion of {len(retry)} message(s)")
+            pending = retry
+
+        return failed_message_ids
+
     def send(
         self,
         message_attributes: Mapping[str, MessageAttributeValueTypeDef],
@@ -138,20 +199,150 @@ class SQSClient:
         logger.debug(f"Sent message: {response['MessageId']}")
         return response
 
-    def receive(self) -> Iterator[MessageTypeDef]:
-        """Receive messages from SQS queue."""
+    def send_batch(
+        self,
+        messages: list[tuple[Mapping[str, MessageAttributeValueTypeDef], str]],
+    ) -> tuple[dict[int, str], dict[int, str]]:
+        """Send a batch of messages via SQS.
+
+        The messages are sent in a single request, unless their total size
+        exceeds the size limit for a batch request, in which case they are split
+        across as few requests as needed. Entries that fail to send are retried
+        once, unless the failure was caused by the sender (e.g., an invalid
+        message attribute).
+
+        Args:
+            messages: A list of up to 10 (message_attributes, message_body) tuples.
+
+        Returns:
+            A tuple of two dicts, both keyed by the position of a message in
+            'messages': the message IDs of the messages that were sent and the
+            error details of the messages that failed to send.
+        """
+        if len(messages) > self.max_batch_entries:
+            raise ValueError(
+                f"Cannot send more than {self.max_batch_entries} messages "
+                f"in a single request, received {len(messages)}"
+            )
+
+        sent_message_ids: dict[int, str] = {}
+        failed_messages: dict[int, str] = {}
+        pending = dict(enumerate(messages))
+        for attempt in range(2):
+            retry = {}
+            for request_messages in self._split_batch_by_size(pending):
+                entries: list[SendMessageBatchRequestEntryTypeDef] = [
+                    {
+                        "Id": str(index),
+                        "MessageAttributes": message_attributes,
+                        "MessageBody": message_body,
+                    }
+                    for index, (
+                        message_attributes,
+                        message_body,
+                    ) in request_messages.items()
+                ]
+                response = self.client.send_message_batch(
+                    QueueUrl=self.queue_url, Entries=entries
+                )
+                for sent_entry in response.get("Successful", []):
+                    sent_message_ids[int(sent_entry["Id"])] = sent_entry["MessageId"]
+                    logger.debug(f"Sent message: {sent_entry['MessageId']}")
+
+                for failed_entry in response.get("Failed", []):
+                    index = int(failed_entry["Id"])
+                    if attempt == 0 and not failed_entry["SenderFault"]:
+                        retry[index] = pending[index]
+                        continue
+                    failed_messages[index] = (
+                        f"{failed_entry['Code']}: {failed_entry.get('Message')}"
+                    )
+
+            if not retry:
+                break
+            logger.warning(f"Retrying sending of {len(retry)} message(s)")
+            pending = retry
+
+        return sent_message_ids, failed_messages
+
+    def _split_batch_by_size(
+        self,
+        messages: dict[int, tuple[Mapping[str, MessageAttributeValueTypeDef], str]],
+    ) -> Iterator[dict[int, tuple[Mapping[str, MessageAttributeValueTypeDef], str]]]:
+        """Split a batch of messages into batches within the batch request size limit.
+
+        A message that exceeds the size limit on its own is yielded in a batch by
+        itself, so that SQS reports the failure for that message only.
+        """
+        batch: dict[int, tuple[Mapping[str, MessageAttributeValueTypeDef], str]] = {}
+        batch_size = 0
+        for index, message in messages.items():
+            message_size = self._get_message_size(*message)
+            if batch and batch_size + message_size > self.max_batch_size:
+                yield batch
+                batch = {}
+                batch_size = 0
+            batch[index] = message
+            batch_size += message_size
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _get_message_size(
+        message_attributes: Mapping[str, MessageAttributeValueTypeDef],
+        message_body: str,
+    ) -> int:
+        """Get the size (in bytes) of a message as counted by SQS.
+
+        The size of a message is the size of its body plus the size of the name,
+        data type, and value of each of its message attributes.
+        """
+        message_size = len(message_body.encode())
+        for name, attribute in message_attributes.items():
+            message_size += len(name.encode()) + len(attribute["DataType"].encode())
+            message_size += len(attribute.get("StringValue", "").encode())
+            binary_value = attribute.get("BinaryValue", b"")
+            if isinstance(binary_value, bytes | str):
+                message_size += len(binary_value)
+        return message_size
+
+    def receive(
+        self, wait_time_seconds: int = 0, visibility_timeout: int | None = None
+    ) -> Iterator[MessageTypeDef]:
+        """Receive messages from SQS queue.
+
+        Messages are requested in batches of up to 10 until a request returns
+        no messages.
+
+        Args:
+            wait_time_seconds: The duration (in seconds) for which a request waits
+                for messages to arrive before returning (i.e., long polling).
+                Long polling queries all SQS servers, which avoids the empty
+                responses short polling can return while messages remain in the
+                queue. Defaults to 0 (short polling).
+            visibility_timeout: The duration (in seconds) that received messages
+                are hidden from subsequent requests. If not set, the visibility
+                timeout configured for the queue is used.
+        """
         message_count = 0
         logger.debug(f"Receiving messages from the queue '{self.queue_name}'")
 
+        receive_kwargs: dict[str, Any] = {
+            "QueueUrl": self.queue_url,
+            "MaxNumberOfMessages": self.max_batch_entries,
+            "MessageAttributeNames": ["All"],
+            "WaitTimeSeconds": wait_time_seconds,
+        }
+        if visibility_timeout is not None:
+            receive_kwargs["VisibilityTimeout"] = visibility_timeout
+
         while True:
-            response = self.client.receive_message(
-                QueueUrl=self.queue_url,
-                MaxNumberOfMessages=10,
-                MessageAttributeNames=["All"],
-            )
+            response = self.client.receive_message(**receive_kwargs)
             if "Messages" in response:
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
                 for message in response["Messages"]:
-                    logger.debug(f"Retrieved message: {message['MessageId']}")
+                    if debug_enabled:
+                        logger.debug(f"Retrieved message: {message['MessageId']}")
                     message_count += 1
                     yield message
             else:
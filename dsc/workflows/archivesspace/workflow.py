@@ -1,4 +1,5 @@
 import logging
+from typing import TYPE_CHECKING
 
 import pandas as pd
 import smart_open
@@ -7,6 +8,9 @@ from dsc.db.models import ItemSubmissionStatus
 from dsc.item_submission import ItemSubmission
 from dsc.workflows.simple_csv import SimpleCSV
 
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,10 +45,17 @@ class ArchivesSpace(SimpleCSV):
 
         handle_uri_mapping = {}
 
-        # find item submissions that were successfully ingested on the current run
+        # find item submissions that were successfully ingested on the current run,
+        # reusing the item submissions finalized in memory when available
+        item_submissions: Iterable[ItemSubmission]
+        if self.finalized_item_submissions is not None:
+            item_submissions = self.finalized_item_submissions
+        else:
+            item_submissions = ItemSubmission.get_batch(self.batch_id)
+
         successful_item_submissions: list[ItemSubmission] = [
             item_submission
-            for item_submission in ItemSubmission.get_batch(self.batch_id)
+            for item_submission in item_submissions
             if item_submission.last_run_date == self.run_date
             and item_submission.status == ItemSubmissionStatus.INGEST_SUCCESS
         ]
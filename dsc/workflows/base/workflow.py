@@ -3,8 +3,11 @@ from __future__ import annotations
 import json
 import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import cached_property, partial
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, final
 
 import jsonschema
@@ -17,13 +20,17 @@ from dsc.exceptions import (
     InvalidSQSMessageError,
     InvalidWorkflowNameError,
 )
-from dsc.item_submission import ItemSubmission
+from dsc.item_submission import (
+    ItemSubmission,
+    MetadataFieldMapping,
+    compile_metadata_mapping,
+)
 from dsc.reports import CreateReport, FinalizeReport, SubmitReport
-from dsc.utils.aws import Metric, MetricsClient, SESClient, SQSClient
+from dsc.utils.aws import Metric, MetricsClient, S3Client, SESClient, SQSClient
 from dsc.utils.validate.schemas import RESULT_MESSAGE_ATTRIBUTES, RESULT_MESSAGE_BODY
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterable, Iterator
 
     from mypy_boto3_sqs.type_defs import MessageTypeDef
 
@@ -32,13 +39,22 @@ if TYPE_CHECKING:  # pragma: no cover
 logger = logging.getLogger(__name__)
 CONFIG = Config()
 
+DYNAMODB_BATCH_WRITE_SIZE = 25
 ITEM_SUBMISSION_LOG_STR = (
     "with primary keys batch_id={batch_id} (hash key) and "
     "item_identifier={item_identifier} (range key)"
 )
 
+# validators are created once, rather than for every result message
+jsonschema.Draft202012Validator.check_schema(RESULT_MESSAGE_ATTRIBUTES)
+jsonschema.Draft202012Validator.check_schema(RESULT_MESSAGE_BODY)
+RESULT_MESSAGE_ATTRIBUTES_VALIDATOR = jsonschema.Draft202012Validator(
+    RESULT_MESSAGE_ATTRIBUTES
+)
+RESULT_MESSAGE_BODY_VALIDATOR = jsonschema.Draft202012Validator(RESULT_MESSAGE_BODY)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DSSResultMessage:
     """Represents a parsed DSpace Submission Service result message."""
 
@@ -66,11 +82,11 @@ class DSSResultMessage:
             InvalidSQSMessageError: If message fails validation
         """
         try:
-            attrs = message.get("MessageAttributes", {})
-            jsonschema.validate(instance=attrs, schema=RESULT_MESSAGE_ATTRIBUTES)
+            attrs = message["MessageAttributes"]
+            RESULT_MESSAGE_ATTRIBUTES_VALIDATOR.validate(attrs)
 
-            body = json.loads(message.get("Body", "{}"))
-            jsonschema.validate(instance=body, schema=RESULT_MESSAGE_BODY)
+            body = json.loads(message["Body"])
+            RESULT_MESSAGE_BODY_VALIDATOR.validate(body)
 
             return cls(
                 item_identifier=attrs["PackageID"]["StringValue"],
@@ -97,6 +113,45 @@ class DSSResultMessage:
             ) from exception
 
 
+class ItemMetadataReader:
+    """Look up item metadata from batch metadata that is read lazily.
+
+    Batch metadata is read from the iterator only as far as needed to find the
+    requested item. Item metadata read ahead of the requested item is cached until
+    it is requested, and cached item metadata is discarded once returned, so the
+    full batch metadata is only held in memory if items are requested in a
+    different order than they are yielded. If item identifiers are given, only
+    item metadata for those item identifiers is cached.
+    """
+
+    def __init__(
+        self,
+        item_metadata_iter: Iterator[dict[str, Any]],
+        item_identifiers: set[str] | None = None,
+    ) -> None:
+        self.item_metadata_iter = item_metadata_iter
+        self.item_identifiers = item_identifiers
+        self.cache: dict[str, dict[str, Any]] = {}
+
+    def get(self, item_identifier: str) -> dict[str, Any] | None:
+        """Get item metadata for an item identifier.
+
+        Returns None if the batch metadata does not include the item identifier.
+        """
+        if item_identifier in self.cache:
+            return self.cache.pop(item_identifier)
+        for item_metadata in self.item_metadata_iter:
+            metadata_item_identifier = item_metadata["item_identifier"]
+            if metadata_item_identifier == item_identifier:
+                return item_metadata
+            if (
+                self.item_identifiers is None
+                or metadata_item_identifier in self.item_identifiers
+            ):
+                self.cache[metadata_item_identifier] = item_metadata
+        return None
+
+
 class Workflow(ABC):
     """A base workflow class from which other workflow classes are derived."""
 
@@ -107,6 +162,16 @@ class Workflow(ABC):
         "submit": SubmitReport,
         "finalize": FinalizeReport,
     }
+    _registry: ClassVar[dict[str, type[Workflow]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Register workflow subclasses by workflow name.
+
+        If multiple subclasses share a workflow name, the most recently defined
+        subclass is registered.
+        """
+        super().__init_subclass__(**kwargs)
+        Workflow._registry[cls.workflow_name] = cls
 
     def __init__(self, batch_id: str) -> None:
         """Initialize base instance.
@@ -141,16 +206,25 @@ class Workflow(ABC):
         # cache list of bitstreams
         self._batch_bitstream_uris: list[str] | None = None
 
+        # item submissions finalized by finalize_items() on the current run
+        self.finalized_item_submissions: list[ItemSubmission] | None = None
+
     @property
     @abstractmethod
     def metadata_mapping_path(self) -> str:
         """Path to the JSON metadata mapping file for the workflow."""
 
-    @property
+    @cached_property
     def metadata_mapping(self) -> dict:
+        """Metadata mapping for the workflow, loaded once per workflow instance."""
         with open(self.metadata_mapping_path) as mapping_file:
             return json.load(mapping_file)
 
+    @cached_property
+    def compiled_metadata_mapping(self) -> tuple[MetadataFieldMapping, ...]:
+        """Metadata mapping for the workflow, resolved once for all items."""
+        return compile_metadata_mapping(self.metadata_mapping)
+
     @final
     @property
     def s3_bucket(self) -> str:
@@ -184,25 +258,65 @@ class Workflow(ABC):
             workflow_name: The label of the workflow. Must match a workflow_name attribute
             from Workflow subclass.
         """
-        for workflow_class in cls._get_subclasses():
-            if workflow_name == workflow_class.workflow_name:
-                return workflow_class
-        raise InvalidWorkflowNameError(f"Invalid workflow name: {workflow_name} ")
-
-    @classmethod
-    def _get_subclasses(cls) -> Iterator[type[Workflow]]:
-        for subclass in cls.__subclasses__():
-            yield from subclass._get_subclasses()  # noqa: SLF001
-            yield subclass
+        try:
+            return cls._registry[workflow_name]
+        except KeyError as exception:
+            raise InvalidWorkflowNameError(
+                f"Invalid workflow name: {workflow_name} "
+            ) from exception
 
     @abstractmethod
     def get_batch_bitstream_uris(self) -> list[str]:
         """Get list of bitstream URIs for a batch."""
 
+    @cached_property
+    def batch_bitstream_uris_by_item(self) -> dict[str, list[str]]:
+        """Bitstream URIs for the batch indexed by candidate item identifiers.
+
+        The batch bitstream URIs are indexed once so that retrieving an item's
+        bitstreams does not require scanning every bitstream URI in the batch.
+        """
+        bitstream_uris_by_item: dict[str, list[str]] = defaultdict(list)
+        for bitstream_uri in self.batch_bitstream_uris:
+            for item_identifier in self._parse_bitstream_item_identifiers(bitstream_uri):
+                bitstream_uris_by_item[item_identifier].append(bitstream_uri)
+        return dict(bitstream_uris_by_item)
+
+    def _parse_bitstream_item_identifiers(self, bitstream_uri: str) -> set[str]:
+        """Get the item identifiers that a bitstream URI may belong to.
+
+        Bitstream filenames either match the item identifier (e.g., '123.pdf') or
+        start with the item identifier followed by a separator (e.g., '123_001.pdf'
+        or '123/001.pdf'). The candidate item identifiers are every substring of
+        the object key (relative to the batch folder) that starts at the beginning
+        of a path segment and ends at a separator ('.', '_', '/') or at the end of
+        the key.
+
+        May be overridden by workflow subclasses that name bitstreams differently.
+        """
+        batch_uri = f"s3://{self.s3_bucket}/{self.batch_path}"
+        if bitstream_uri.startswith(batch_uri):
+            key = bitstream_uri.removeprefix(batch_uri)
+        else:
+            key = bitstream_uri.removeprefix("s3://").partition("/")[2]
+
+        starts = [0] + [index + 1 for index, char in enumerate(key) if char == "/"]
+        ends = [index for index, char in enumerate(key) if char in "._/"]
+        ends.append(len(key))
+        return {key[start:end] for start in starts for end in ends if end > start}
+
     @final
     def get_item_bitstream_uris(self, item_identifier: str) -> list[str]:
-        """Get list of bitstreams URIs for an item."""
-        return [uri for uri in self.batch_bitstream_uris if item_identifier in uri]
+        """Get list of bitstreams URIs for an item.
+
+        A bitstream belongs to an item if the item identifier starts a path
+        segment of the bitstream's object key and is followed by a separator
+        ('.', '_', '/') or the end of the key (see
+        Workflow._parse_bitstream_item_identifiers). Bitstreams named otherwise
+        (e.g., 'mit_123.pdf' or '123 (1).pdf' for item '123') do not belong to
+        the item.
+        """
+        return list(self.batch_bitstream_uris_by_item.get(item_identifier, []))
 
     @abstractmethod
     def item_metadata_iter(self) -> Iterator[dict[str, Any]]:
@@ -257,11 +371,30 @@ class Workflow(ABC):
         This method loops through the item submissions (init params)
         represented as a list dicts. For each item submission, the
         method creates an instance of ItemSubmission and saves the
-        record to DynamoDB.
+        record to DynamoDB. Records are saved concurrently using a thread
+        pool; every record is attempted, each failure is logged, and the
+        first failure is then raised.
         """
-        for item_submission in item_submissions:
-            item_submission.last_run_date = self.run_date
-            item_submission.save()
+        with ThreadPoolExecutor(max_workers=CONFIG.max_workers) as executor:
+            futures = [
+                executor.submit(self._create_item_submission_in_db, item_submission)
+                for item_submission in item_submissions
+            ]
+
+        first_exception: BaseException | None = None
+        for item_submission, future in zip(item_submissions, futures, strict=True):
+            if exception := future.exception():
+                logger.error(
+                    "Failed to create record for item submission "
+                    f"'{item_submission.item_identifier}': {exception}"
+                )
+                first_exception = first_exception or exception
+        if first_exception:
+            raise first_exception
+
+    def _create_item_submission_in_db(self, item_submission: ItemSubmission) -> None:
+        item_submission.last_run_date = self.run_date
+        item_submission.save()
 
     def submit_items(self, collection_handle: str | None = None) -> list:
         """Submit items to the DSpace Submission Service according to the workflow class.
@@ -274,83 +407,259 @@ class Workflow(ABC):
         Returns a dict with the submission results organized into succeeded and failed
         items.
         """
+        input_queue = CONFIG.sqs_queue_dss_input
         logger.info(
-            f"Submitting messages to the DSS input queue '{CONFIG.sqs_queue_dss_input}' "
+            f"Submitting messages to the DSS input queue '{input_queue}' "
             f"for batch '{self.batch_id}'"
         )
 
-        batch_metadata = {
-            item_metadata["item_identifier"]: item_metadata
-            for item_metadata in self.item_metadata_iter()
-        }
+        submission_summary = self.submission_summary
+        run_date = self.run_date
 
-        items = []
+        # find the item submissions to submit before reading batch metadata, so
+        # that metadata for skipped item submissions is not kept in memory
+        item_submissions_to_submit = []
         for item_submission in ItemSubmission.get_batch(self.batch_id):
-            self.submission_summary["total"] += 1
-            item_identifier = item_submission.item_identifier
-            logger.debug(f"Preparing submission for item: {item_identifier}")
-            item_submission.last_run_date = self.run_date
+            submission_summary["total"] += 1
+            logger.debug(
+                f"Preparing submission for item: {item_submission.item_identifier}"
+            )
+            item_submission.last_run_date = run_date
 
             # validate whether a message should be sent for this item submission
             if not item_submission.ready_to_submit():
-                self.submission_summary["skipped"] += 1
+                submission_summary["skipped"] += 1
                 continue
-            try:
-                # prepare submission assets
-                item_submission.prepare_dspace_metadata(
-                    metadata_mapping=self.metadata_mapping,
-                    item_metadata=batch_metadata[item_identifier],
-                    s3_bucket=self.s3_bucket,
-                    batch_path=self.batch_path,
-                )
-                item_submission.bitstream_s3_uris = self.get_item_bitstream_uris(
-                    item_identifier
-                )
+            item_submissions_to_submit.append(item_submission)
 
-                item_submission.collection_handle = (
-                    collection_handle
-                    or self._get_item_collection_handle(batch_metadata[item_identifier])
-                )
+        item_results: list[dict[str, str] | None] = []
+        if item_submissions_to_submit:
+            item_results = self._submit_item_submissions_in_groups(
+                item_submissions_to_submit, collection_handle, input_queue
+            )
+        items = [item_data for item_data in item_results if item_data]
+        submission_summary["submitted"] += len(items)
+        submission_summary["errors"] += len(item_results) - len(items)
 
-                # Send submission message to DSS input queue
-                response = item_submission.send_submission_message(
-                    submission_source=self.workflow_name,
-                    output_queue=self.output_queue,
-                    submission_system=self.submission_system,
-                    collection_handle=item_submission.collection_handle,
-                )
+        logger.info(
+            f"Submitted messages to the DSS input queue '{input_queue}' "
+            f"for batch '{self.batch_id}': {json.dumps(self.submission_summary)}"
+        )
+        return items
+
+    def _submit_item_submissions_in_groups(
+        self,
+        item_submissions: list[ItemSubmission],
+        collection_handle: str | None,
+        input_queue: str,
+    ) -> list[dict[str, str] | None]:
+        """Submit item submissions concurrently, in groups of up to 10.
+
+        Each group is submitted by a single worker (see
+        Workflow._submit_item_submission_group). The number of groups submitted
+        to the thread pool at once is bounded, so batch metadata is only read
+        ahead as far as the groups in flight.
+
+        Returns:
+            list[dict[str, str] | None]: For each item submission, the item
+                identifier and the message ID of the submission message, or None
+                if the item submission failed.
+        """
+        # index batch bitstreams once, before item submissions read them concurrently
+        _ = self.batch_bitstream_uris_by_item
+
+        # resolve values shared by all item submissions once, outside the loop
+        submit_group = partial(
+            self._submit_item_submission_group,
+            prepare_item=partial(
+                self._prepare_item_submission,
+                collection_handle=collection_handle,
+                metadata_mapping=self.compiled_metadata_mapping,
+                s3_bucket=self.s3_bucket,
+                batch_path=self.batch_path,
+                output_queue=self.output_queue,
+                s3_client=S3Client(max_pool_connections=CONFIG.max_workers),
+            ),
+            sqs_client=SQSClient(region=CONFIG.aws_region_name, queue_name=input_queue),
+        )
+        get_item_metadata = ItemMetadataReader(
+            self.item_metadata_iter(),
+            item_identifiers={
+                item_submission.item_identifier for item_submission in item_submissions
+            },
+        ).get
+
+        group_size = SQSClient.max_batch_entries
+        max_groups_in_flight = 2 * CONFIG.max_workers
+        item_results: list[dict[str, str] | None] = []
+        with ThreadPoolExecutor(max_workers=CONFIG.max_workers) as executor:
+            futures: deque[Future[list[dict[str, str] | None]]] = deque()
+            for index in range(0, len(item_submissions), group_size):
+                if len(futures) >= max_groups_in_flight:
+                    item_results.extend(futures.popleft().result())
+                group = [
+                    (item_submission, get_item_metadata(item_submission.item_identifier))
+                    for item_submission in item_submissions[index : index + group_size]
+                ]
+                futures.append(executor.submit(submit_group, group))
+            while futures:
+                item_results.extend(futures.popleft().result())
+        return item_results
+
+    def _submit_item_submission_group(
+        self,
+        item_submissions: list[tuple[ItemSubmission, dict[str, Any] | None]],
+        *,
+        prepare_item: Callable[
+            [ItemSubmission, dict[str, Any] | None], tuple[dict[str, Any], str] | None
+        ],
+        sqs_client: SQSClient,
+    ) -> list[dict[str, str] | None]:
+        """Prepare a group of item submissions and send their submission messages.
+
+        The submission messages for the item submissions that were prepared are
+        sent in a single batch request, and their records are updated in a single
+        batch write.
 
-                # Record details of the item submission message
-                item_data = {
-                    "item_identifier": item_identifier,
-                    "message_id": response["MessageId"],
-                }
-                items.append(item_data)
-                self.submission_summary["submitted"] += 1
+        Args:
+            item_submissions: Up to 10 (item submission, item metadata) tuples.
+            prepare_item: Workflow._prepare_item_submission, with the values shared
+                by all item submissions already bound.
+            sqs_client: SQSClient for the DSS input queue.
 
-                logger.info(f"Sent item submission message: {item_data['message_id']}")
+        Returns:
+            list[dict[str, str] | None]: For each item submission, the item
+                identifier and the message ID of the submission message, or None
+                if the item submission failed.
+        """
+        item_results: list[dict[str, str] | None] = []
+        prepared_item_submissions = []
+        for item_submission, item_metadata in item_submissions:
+            if (message := prepare_item(item_submission, item_metadata)) is None:
+                item_results.append(None)
+                continue
+            prepared_item_submissions.append((item_submission, message))
+        if prepared_item_submissions:
+            item_results.extend(
+                self._send_submission_messages(sqs_client, prepared_item_submissions)
+            )
+        return item_results
 
-                # Set status in DynamoDB
+    def _prepare_item_submission(
+        self,
+        item_submission: ItemSubmission,
+        item_metadata: dict[str, Any] | None,
+        *,
+        collection_handle: str | None,
+        metadata_mapping: tuple[MetadataFieldMapping, ...],
+        s3_bucket: str,
+        batch_path: str,
+        output_queue: str,
+        s3_client: S3Client,
+    ) -> tuple[dict[str, Any], str] | None:
+        """Prepare submission assets and the submission message for an item.
+
+        This method is run concurrently for the item submissions in a batch. The
+        keyword arguments are the same for every item submission and are resolved
+        once by Workflow.submit_items. If the item submission cannot be prepared,
+        its record is updated with the failure.
+
+        Returns:
+            tuple[dict[str, Any], str] | None: The attributes and body of the
+                submission message, or None if the item submission failed.
+        """
+        item_identifier = item_submission.item_identifier
+        try:
+            if item_metadata is None:
+                raise KeyError(item_identifier)  # noqa: TRY301
+
+            # prepare submission assets
+            item_submission.prepare_dspace_metadata(
+                metadata_mapping=metadata_mapping,
+                item_metadata=item_metadata,
+                s3_bucket=s3_bucket,
+                batch_path=batch_path,
+                s3_client=s3_client,
+            )
+            item_submission.bitstream_s3_uris = self.get_item_bitstream_uris(
+                item_identifier
+            )
+
+            item_submission.collection_handle = (
+                collection_handle or self._get_item_collection_handle(item_metadata)
+            )
+
+            return item_submission.create_submission_message(
+                submission_source=self.workflow_name,
+                output_queue=output_queue,
+                submission_system=self.submission_system,
+                collection_handle=item_submission.collection_handle,
+            )
+        except NotImplementedError:
+            raise
+        except Exception as exception:  # noqa: BLE001
+            item_submission.status = ItemSubmissionStatus.SUBMIT_FAILED
+            item_submission.status_details = str(exception)
+            item_submission.submit_attempts += 1
+            item_submission.upsert_db()
+            self._publish_count_metric("submission_error", f"item {item_identifier}")
+            return None
+
+    def _send_submission_messages(
+        self,
+        sqs_client: SQSClient,
+        item_submissions: list[tuple[ItemSubmission, tuple[dict[str, Any], str]]],
+    ) -> list[dict[str, str] | None]:
+        """Send submission messages for prepared item submissions in a batch request.
+
+        The records for the item submissions are then updated with the results in
+        a single batch write.
+
+        Args:
+            sqs_client: SQSClient for the DSS input queue.
+            item_submissions: Up to 10 (item submission, (message attributes,
+                message body)) tuples.
+
+        Returns:
+            list[dict[str, str] | None]: For each item submission, in order, the item
+                identifier and the message ID of the submission message, or None if
+                the submission message failed to send.
+        """
+        try:
+            sent_message_ids, failed_messages = sqs_client.send_batch(
+                [message for _, message in item_submissions]
+            )
+        except Exception as exception:
+            logger.exception("Failed to send batch of submission messages")
+            sent_message_ids = {}
+            failed_messages = dict.fromkeys(range(len(item_submissions)), str(exception))
+
+        items: list[dict[str, str] | None] = []
+        for index, (item_submission, _) in enumerate(item_submissions):
+            item_identifier = item_submission.item_identifier
+            item_submission.submit_attempts += 1
+            if message_id := sent_message_ids.get(index):
+                logger.info(f"Sent item submission message: {message_id}")
                 item_submission.status = ItemSubmissionStatus.SUBMIT_SUCCESS
                 item_submission.status_details = None
-                item_submission.submit_attempts += 1
-                item_submission.upsert_db()
+                items.append(
+                    {"item_identifier": item_identifier, "message_id": message_id}
+                )
                 self._publish_count_metric("item_submitted", f"item {item_identifier}")
-            except NotImplementedError:
-                raise
-            except Exception as exception:  # noqa: BLE001
-                self.submission_summary["errors"] += 1
-                item_submission.status = ItemSubmissionStatus.SUBMIT_FAILED
-                item_submission.status_details = str(exception)
-                item_submission.submit_attempts += 1
-                item_submission.upsert_db()
-                self._publish_count_metric(
-                    "submission_error", f"item {item_submission.item_identifier}"
+            else:
+                error = failed_messages.get(index, "Unknown error")
+                logger.error(
+                    f"Failed to send submission message for item: {item_identifier}. "
+                    f"{error}"
                 )
+                item_submission.status = ItemSubmissionStatus.SUBMIT_FAILED
+                item_submission.status_details = error
+                items.append(None)
+                self._publish_count_metric("submission_error", f"item {item_identifier}")
 
-        logger.info(
-            f"Submitted messages to the DSS input queue '{CONFIG.sqs_queue_dss_input}' "
-            f"for batch '{self.batch_id}': {json.dumps(self.submission_summary)}"
+        # set statuses in DynamoDB
+        ItemSubmission.batch_upsert_db(
+            item_submission for item_submission, _ in item_submissions
         )
         return items
 
@@ -368,98 +677,238 @@ class Workflow(ABC):
         )
 
     @final
-    def finalize_items(self) -> None:
+    def finalize_items(
+        self,
+        wait_time_seconds: int | None = None,
+        visibility_timeout: int | None = None,
+    ) -> None:
         """Examine results for all item submissions in the batch.
 
         This method involves three main steps:
 
         1. Process DSS result messages from the output queue
         2. Apply workflow-specific processing
+
+        Args:
+            wait_time_seconds: The duration (in seconds) for which each request
+                to the output queue waits for result messages to arrive (long
+                polling). Defaults to the SQS_WAIT_TIME_SECONDS env var.
+            visibility_timeout: The duration (in seconds) that received result
+                messages are hidden from subsequent requests. If not set, the
+                visibility timeout configured for the output queue is used.
         """
+        output_queue = self.output_queue
         logger.info(
-            f"Processing DSS result messages from the output queue '{self.output_queue}'"
+            f"Processing DSS result messages from the output queue '{output_queue}'"
         )
         sqs_results_summary = {
             "received_messages": 0,
             "ingest_success": 0,
             "ingest_failed": 0,
             "ingest_unknown": 0,
+            "delete_failed": 0,
         }
 
         # retrieve and create map of result messages
-        sqs_client = SQSClient(
-            region=CONFIG.aws_region_name, queue_name=self.output_queue
-        )
+        sqs_client = SQSClient(region=CONFIG.aws_region_name, queue_name=output_queue)
         logger.info(
-            f"Processing DSS result messages from the output queue '{self.output_queue}'"
+            f"Processing DSS result messages from the output queue '{output_queue}'"
         )
+        if wait_time_seconds is None:
+            wait_time_seconds = CONFIG.sqs_wait_time_seconds
+
+        # drain the output queue with concurrent pollers
         result_message_map: dict[str, DSSResultMessage] = {}
-        for message in sqs_client.receive():
-            try:
-                result_message_object = DSSResultMessage.from_result_message(message)
-                result_message_map[result_message_object.item_identifier] = (
-                    result_message_object
+        with ThreadPoolExecutor(max_workers=CONFIG.max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._receive_result_messages,
+                    sqs_client,
+                    wait_time_seconds,
+                    visibility_timeout,
                 )
-            except InvalidSQSMessageError:
-                logger.exception(f"Failure parsing message '{message}'")
-                continue
+                for _ in range(CONFIG.max_workers)
+            ]
+            for future in futures:
+                result_message_map.update(future.result())
 
         sqs_results_summary["received_messages"] = len(result_message_map)
 
         # retrieve item submissions from batch
-        for item_submission in ItemSubmission.get_batch(self.batch_id):
-            log_str = ITEM_SUBMISSION_LOG_STR.format(
-                batch_id=self.batch_id, item_identifier=item_submission.item_identifier
+        item_submissions: Iterable[ItemSubmission] = []
+        if result_message_map:
+            item_submissions = ItemSubmission.get_batch(self.batch_id)
+        else:
+            logger.info(
+                "No DSS result messages received, skipping item submissions "
+                f"for batch '{self.batch_id}'"
             )
-            if item_submission.status == ItemSubmissionStatus.INGEST_SUCCESS:
-                logger.debug(f"Record {log_str} already ingested, skipping")
-                continue
-
-            item_submission.ingest_attempts += 1
 
-            result_message = result_message_map.get(item_submission.item_identifier)
+        batch_id = self.batch_id
+        run_date = self.run_date
 
-            # skip item submission if result message is not found
-            if not result_message:
-                continue
-
-            # update item submission status based on ingest result
-            if result_message.result_type == "success":
-                item_submission.status = ItemSubmissionStatus.INGEST_SUCCESS
-                item_submission.status_details = None
-                item_submission.dspace_handle = (
-                    f"https://hdl.handle.net/{result_message.dspace_handle}"
-                )
-                sqs_results_summary["ingest_success"] += 1
-                logger.debug(f"Record {log_str} was ingested")
-                self._publish_count_metric("ingested_item", f"record {log_str}")
-            elif result_message.result_type == "error":
-                item_submission.status = ItemSubmissionStatus.INGEST_FAILED
-                item_submission.status_details = result_message.error_info
-                sqs_results_summary["ingest_failed"] += 1
-                logger.debug(f"Record {log_str} failed to ingest")
-                self._publish_count_metric("ingest_error", f"record {log_str}")
-
-            else:
-                item_submission.status = ItemSubmissionStatus.INGEST_UNKNOWN
-                sqs_results_summary["ingest_unknown"] += 1
-                logger.debug(f"Unable to determine ingest status for record {log_str}")
-            item_submission.last_result_message = str(result_message.raw_message)
-            item_submission.last_run_date = self.run_date
-            item_submission.upsert_db()
-            sqs_client.delete(
-                receipt_handle=result_message.receipt_handle,
-                message_id=result_message.message_id,
-            )
+        # records are written and result messages deleted by a thread pool,
+        # while the main thread continues processing the batch
+        save_futures: list[Future[int]] = []
+        self.finalized_item_submissions = []
+        with ThreadPoolExecutor(max_workers=CONFIG.max_workers) as executor:
+            finalized_item_submissions: list[ItemSubmission] = []
+            messages_to_delete: list[tuple[str, str]] = []
+            try:
+                for item_submission in item_submissions:
+                    if item_submission.status == ItemSubmissionStatus.INGEST_SUCCESS:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                f"Record {
+                                    ITEM_SUBMISSION_LOG_STR.format(
+                                        batch_id=batch_id,
+                                        item_identifier=item_submission.item_identifier,
+                                    )
+                                } already ingested, skipping"
+                            )
+                        continue
+
+                    item_submission.ingest_attempts += 1
+
+                    result_message = result_message_map.get(
+                        item_submission.item_identifier
+                    )
+
+                    # skip item submission if result message is not found
+                    if not result_message:
+                        continue
+
+                    log_str = ITEM_SUBMISSION_LOG_STR.format(
+                        batch_id=batch_id, item_identifier=item_submission.item_identifier
+                    )
+
+                    # update item submission status based on ingest result
+                    if result_message.result_type == "success":
+                        item_submission.status = ItemSubmissionStatus.INGEST_SUCCESS
+                        item_submission.status_details = None
+                        item_submission.dspace_handle = (
+                            f"https://hdl.handle.net/{result_message.dspace_handle}"
+                        )
+                        sqs_results_summary["ingest_success"] += 1
+                        logger.debug(f"Record {log_str} was ingested")
+                        self._publish_count_metric("ingested_item", f"record {log_str}")
+                    elif result_message.result_type == "error":
+                        item_submission.status = ItemSubmissionStatus.INGEST_FAILED
+                        item_submission.status_details = result_message.error_info
+                        sqs_results_summary["ingest_failed"] += 1
+                        logger.debug(f"Record {log_str} failed to ingest")
+                        self._publish_count_metric("ingest_error", f"record {log_str}")
+
+                    else:
+                        item_submission.status = ItemSubmissionStatus.INGEST_UNKNOWN
+                        sqs_results_summary["ingest_unknown"] += 1
+                        logger.debug(
+                            f"Unable to determine ingest status for record {log_str}"
+                        )
+                    item_submission.last_result_message = str(result_message.raw_message)
+                    item_submission.last_run_date = run_date
+
+                    # write records and delete result messages in batches
+                    finalized_item_submissions.append(item_submission)
+                    self.finalized_item_submissions.append(item_submission)
+                    messages_to_delete.append(
+                        (result_message.message_id, result_message.receipt_handle)
+                    )
+                    if len(finalized_item_submissions) >= DYNAMODB_BATCH_WRITE_SIZE:
+                        save_futures.append(
+                            executor.submit(
+                                self._save_finalized_items,
+                                sqs_client,
+                                finalized_item_submissions,
+                                messages_to_delete,
+                            )
+                        )
+                        finalized_item_submissions = []
+                        messages_to_delete = []
+            finally:
+                # write records processed before any error and delete their
+                # result messages
+                if finalized_item_submissions:
+                    save_futures.append(
+                        executor.submit(
+                            self._save_finalized_items,
+                            sqs_client,
+                            finalized_item_submissions,
+                            messages_to_delete,
+                        )
+                    )
+
+        # raise any errors from writing records, and count result messages that
+        # failed to delete, as they will be received again on the next run
+        for save_future in save_futures:
+            sqs_results_summary["delete_failed"] += save_future.result()
 
         # optional method used for some workflows
         self.workflow_specific_processing()
 
         logger.info(
-            f"Processed DSS result messages from the output queue '{self.output_queue}': "
+            f"Processed DSS result messages from the output queue '{output_queue}': "
             f"{json.dumps(sqs_results_summary)}"
         )
 
+    @staticmethod
+    def _save_finalized_items(
+        sqs_client: SQSClient,
+        item_submissions: list[ItemSubmission],
+        messages: list[tuple[str, str]],
+    ) -> int:
+        """Upsert records for finalized item submissions and delete result messages.
+
+        Result messages are only deleted from the output queue once the records
+        for the corresponding item submissions are written to DynamoDB.
+
+        Args:
+            sqs_client: SQSClient for the output queue.
+            item_submissions: Finalized item submissions.
+            messages: List of (message ID, receipt handle) tuples for the result
+                messages of the finalized item submissions.
+
+        Returns:
+            int: The number of result messages that failed to delete.
+        """
+        ItemSubmission.batch_upsert_db(item_submissions)
+        failed_deletes = 0
+        for index in range(0, len(messages), sqs_client.max_batch_entries):
+            failed_deletes += len(
+                sqs_client.delete_batch(
+                    messages[index : index + sqs_client.max_batch_entries]
+                )
+            )
+        return failed_deletes
+
+    @staticmethod
+    def _receive_result_messages(
+        sqs_client: SQSClient,
+        wait_time_seconds: int,
+        visibility_timeout: int | None,
+    ) -> dict[str, DSSResultMessage]:
+        """Receive and parse DSS result messages until the output queue is drained.
+
+        This method is run concurrently by multiple workers, each of which stops
+        once a request to the output queue returns no messages.
+
+        Returns:
+            dict[str, DSSResultMessage]: Result messages keyed by item identifier.
+        """
+        result_message_map: dict[str, DSSResultMessage] = {}
+        for message in sqs_client.receive(
+            wait_time_seconds=wait_time_seconds, visibility_timeout=visibility_timeout
+        ):
+            try:
+                result_message_object = DSSResultMessage.from_result_message(message)
+                result_message_map[result_message_object.item_identifier] = (
+                    result_message_object
+                )
+            except InvalidSQSMessageError:
+                logger.exception(f"Failure parsing message '{message}'")
+                continue
+        return result_message_map
+
     def workflow_specific_processing(self) -> None:
         logger.info(
             f"No extra processing for batch based on workflow: '{self.workflow_name}' "
@@ -510,9 +959,13 @@ class Workflow(ABC):
             errors=errors,
         )
 
+        # create attachments once for upload and email
+        attachments = report.prepare_attachments()
+
         # upload attachments to S3
         report.upload_attachments(
-            output_location=(f"s3://{self.s3_bucket}/{self.batch_path}")
+            output_location=(f"s3://{self.s3_bucket}/{self.batch_path}"),
+            attachments=attachments,
         )
 
         # send email
@@ -522,6 +975,6 @@ class Workflow(ABC):
             source_email_address=CONFIG.source_email,
             recipient_email_addresses=email_recipients,
             message_body=report.generate_summary(),
-            attachments=report.prepare_attachments(),
+            attachments=attachments,
         )
         logger.info(f"Sent report to recipients: {email_recipients}")
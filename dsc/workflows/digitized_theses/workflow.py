@@ -157,31 +157,24 @@ class DigitizedTheses(Workflow):
     def _get_item_submissions_from_synced_batch(self) -> list[ItemSubmission]:
         """Create ItemSubmission's from a synced batch folder in the DSC S3 bucket.
 
-        This method loops through the uris for objects in the synced batch folder.
-        From each uri, the method extracts the theses subfolder and the item identifier
-        for an item submission. The theses subfolder determines the ItemSubmission.status
-        to set in DynamoDB:
+        This method loops through the item subfolders in each theses subfolder of
+        the synced batch folder (see _synced_batch_item_subfolders_iter). From each
+        item subfolder, the method gets the theses subfolder and the item identifier
+        for an item submission. The theses subfolder determines the
+        ItemSubmission.status to set in DynamoDB:
             - Item submissions in replacement-theses or new-theses -> CREATE_SUCCESS
             - Item submissions in skipped-theses -> CREATE_SKIPPED
 
-        As the method loops through the uris, it checks against a list of seen
-        item identifiers to avoid duplicates.
+        As the method loops through the item subfolders, it checks against a set of
+        seen item identifiers to avoid duplicates.
         """
         item_submissions = []
-        s3_client = S3Client()
-
-        # pattern to extract meta about item submission from uri
-        pattern = r"/(?:[^/]+/)*?([a-zA-Z0-9-]*-theses)/(\d+)(?:/.*)?$"
-
-        seen_item_identifiers = []
-        for uri in s3_client.files_iter(bucket=self.s3_bucket, prefix=self.batch_path):
-            match = re.search(pattern, uri)
-            if not match:
-                logger.warning(f"Cannot create item submission for uri: {uri}")
-                continue
 
-            # retrieve theses subfolder and item identifier from uri
-            theses_subfolder, item_identifier = match.groups()
+        seen_item_identifiers: set[str] = set()
+        for (
+            theses_subfolder,
+            item_identifier,
+        ) in self._synced_batch_item_subfolders_iter():
             if item_identifier in seen_item_identifiers:
                 logger.debug(
                     f"Already created an item submission for item_identifier={item_identifier}"  # noqa: E501
@@ -189,7 +182,7 @@ class DigitizedTheses(Workflow):
                 continue
 
             # track identifier as 'seen'
-            seen_item_identifiers.append(item_identifier)
+            seen_item_identifiers.add(item_identifier)
 
             # create an instance of ItemSubmission
             item_submission = ItemSubmission(
@@ -221,6 +214,52 @@ class DigitizedTheses(Workflow):
 
         return item_submissions
 
+    def _synced_batch_item_subfolders_iter(self) -> Iterator[tuple[str, str]]:
+        """Yield the theses subfolder and item identifier of each item subfolder.
+
+        An item subfolder is a subfolder named with the item identifier (digits only)
+        directly under a theses subfolder (e.g., 'new-theses/<item identifier>/').
+        Theses subfolders may be nested at any depth in the synced batch folder
+        (see _item_subfolders_iter).
+        """
+        yield from self._item_subfolders_iter(S3Client(), self.batch_path)
+
+    def _item_subfolders_iter(
+        self, s3_client: S3Client, prefix: str
+    ) -> Iterator[tuple[str, str]]:
+        """Search a folder recursively for item subfolders.
+
+        Subfolders that are not item subfolders are searched recursively. Only the
+        subfolders are listed, using S3 common prefixes, so each listing returns
+        one entry per subfolder rather than one entry per file. A warning is logged
+        for each folder without subfolders, as no item submissions can be created
+        from it.
+
+        Args:
+            s3_client: The S3 client used to list subfolders.
+            prefix: The prefix of the folder to search for item subfolders.
+        """
+        parent_folder = prefix.rstrip("/").rpartition("/")[2]
+        theses_subfolder = (
+            parent_folder
+            if re.fullmatch(r"[a-zA-Z0-9-]*-theses", parent_folder)
+            else None
+        )
+
+        has_subfolders = False
+        for subfolder_prefix in s3_client.subfolders_iter(
+            bucket=self.s3_bucket, prefix=prefix
+        ):
+            has_subfolders = True
+            subfolder = subfolder_prefix.rstrip("/").rpartition("/")[2]
+            if theses_subfolder and subfolder.isdigit():
+                yield theses_subfolder, subfolder
+                continue
+            yield from self._item_subfolders_iter(s3_client, subfolder_prefix)
+
+        if not has_subfolders:
+            logger.warning(f"Cannot create item submissions for subfolder: {prefix}")
+
     def _create_batch_in_s3(self) -> list[ItemSubmission]:
         """Create a batch of item submissions in the DSC S3 bucket.
 
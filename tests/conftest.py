@@ -134,6 +134,7 @@ def _test_env(monkeypatch):
     monkeypatch.setenv("S3_BUCKET_SUBMISSION_ASSETS", "dsc")
     monkeypatch.setenv("SOURCE_EMAIL", "noreply@example.com")
     monkeypatch.setenv("SQS_QUEUE_DSS_INPUT", "mock-input-queue")
+    monkeypatch.setenv("SQS_WAIT_TIME_SECONDS", "0")
     # workflow-specific
     monkeypatch.setenv(
         "DSPACE_CREDENTIALS",
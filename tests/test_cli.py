@@ -258,6 +258,7 @@ def test_finalize_success(
         "ingest_success": 1,
         "ingest_failed": 0,
         "ingest_unknown": 0,
+        "delete_failed": 0,
     }
 
     result = runner.invoke(
@@ -288,6 +289,31 @@ def test_finalize_success(
     assert "Total time elapsed" in caplog.text
 
 
+@patch("dsc.workflows.base.workflow.Workflow.send_report")
+@patch("dsc.workflows.base.workflow.Workflow.finalize_items")
+def test_finalize_passes_visibility_timeout(
+    mock_finalize_items, mock_send_report, runner, base_workflow_instance
+):
+    result = runner.invoke(
+        main,
+        [
+            "--workflow-name",
+            "test",
+            "--batch-id",
+            "batch-aaa",
+            "finalize",
+            "--email-recipients",
+            "test@test.test",
+            "--visibility-timeout",
+            "600",
+        ],
+    )
+
+    assert result.exit_code == 0
+    mock_finalize_items.assert_called_once_with(visibility_timeout=600)
+    mock_send_report.assert_called_once()
+
+
 def test_sync_success(caplog, runner, monkeypatch, moto_server, config_instance):
     """Run sync using moto stand-alone server."""
     caplog.set_level("DEBUG")
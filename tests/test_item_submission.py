@@ -10,7 +10,11 @@ from dsc.exceptions import (
     ItemMetadataMissingRequiredFieldError,
     SQSMessageSendError,
 )
-from dsc.item_submission import ItemSubmission
+from dsc.item_submission import (
+    ItemSubmission,
+    MetadataFieldMapping,
+    compile_metadata_mapping,
+)
 
 
 def test_itemsubmission_init_success(item_submission_instance, dspace_metadata):
@@ -103,6 +107,24 @@ def test_itemsubmission_upsert_db_excludes_metadata_and_bitstreams(
     assert hasattr(record, "bitstream_s3_uris") is False
 
 
+def test_itemsubmission_batch_upsert_db_success(mock_item_submission_db):
+    item_submissions = [
+        ItemSubmission(
+            batch_id="batch-aaa",
+            item_identifier=str(item_identifier),
+            workflow_name="test",
+            status=ItemSubmissionStatus.INGEST_SUCCESS,
+        )
+        for item_identifier in range(30)
+    ]
+
+    ItemSubmission.batch_upsert_db(item_submissions)
+
+    records = list(ItemSubmissionDB.query("batch-aaa"))
+    assert len(records) == 30  # noqa: PLR2004
+    assert all(record.status == ItemSubmissionStatus.INGEST_SUCCESS for record in records)
+
+
 def test_exceeded_retry_threshold_false(item_submission_instance):
     item_submission_instance.ingest_attempts = 17
     item_submission_instance.status = ItemSubmissionStatus.SUBMIT_SUCCESS
@@ -174,6 +196,45 @@ def test_itemsubmission_create_dspace_metadata_success(
     }
 
 
+def test_compile_metadata_mapping_success(metadata_mapping):
+    metadata_mapping["item_identifier"] = {
+        "source_field_name": "item_identifier",
+        "required": True,
+    }
+    assert compile_metadata_mapping(metadata_mapping) == (
+        MetadataFieldMapping(
+            field_name="dc.title",
+            source_field_name="title",
+            delimiter=None,
+            required=True,
+        ),
+        MetadataFieldMapping(
+            field_name="dc.contributor",
+            source_field_name="contributor",
+            delimiter="|",
+            required=False,
+        ),
+        MetadataFieldMapping(
+            field_name="dc.subject",
+            source_field_name="topics",
+            delimiter=None,
+            required=False,
+        ),
+    )
+
+
+def test_itemsubmission_create_dspace_metadata_with_compiled_mapping_success(
+    item_submission_instance, item_metadata, metadata_mapping
+):
+    item_submission_instance.create_dspace_metadata(
+        item_metadata, compile_metadata_mapping(metadata_mapping)
+    )
+    assert item_submission_instance.dspace_metadata == {
+        "dc.title": [{"value": "Title"}],
+        "dc.contributor": [{"value": "Author 1"}, {"value": "Author 2"}],
+    }
+
+
 def test_itemsubmission_create_dspace_metadata_required_field_missing_raises_exception(
     item_submission_instance, item_metadata, metadata_mapping
 ):
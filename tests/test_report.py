@@ -1,6 +1,7 @@
 # ruff: noqa: TD002, TD003, FIX002
 import os
 from io import StringIO
+from unittest.mock import patch
 
 from freezegun import freeze_time
 
@@ -73,6 +74,22 @@ def test_report_upload_attachments(mock_item_submission_db_with_records, tmp_pat
     assert os.path.exists(tmp_path / "aaa-item-submissions.csv")
 
 
+def test_report_upload_attachments_with_prepared_attachments(
+    mock_item_submission_db_with_records, tmp_path
+):
+    create_report = CreateReport(workflow_name="test", batch_id="aaa")
+    attachments = create_report.prepare_attachments()
+
+    with patch.object(create_report, "prepare_attachments") as prepare_attachments:
+        create_report.upload_attachments(
+            output_location=str(tmp_path), attachments=attachments
+        )
+
+    prepare_attachments.assert_not_called()
+    assert os.path.exists(tmp_path / "aaa-item-submissions.csv")
+    assert attachments[0][1].read().startswith("batch_id,item_identifier")
+
+
 def test_report_create_item_submissions_csv(mock_item_submission_db_with_records):
     create_report = CreateReport(workflow_name="test", batch_id="aaa")
     output = create_report.create_item_submissions_csv()
@@ -5,6 +5,13 @@ from http import HTTPStatus
 import pytest
 from botocore.exceptions import ClientError
 
+from dsc.utils.aws.s3 import S3Client
+
+
+def test_s3_client_max_pool_connections_success(mocked_s3):
+    s3_client = S3Client(max_pool_connections=32)
+    assert s3_client.client.meta.config.max_pool_connections == 32  # noqa: PLR2004
+
 
 def test_s3_client_move_file_success(mocked_s3, s3_client):
     s3_client.put_file(
@@ -43,6 +50,18 @@ def test_s3_client_put_file_success(mocked_s3, s3_client):
     )
 
 
+def test_s3_client_subfolders_iter_success(mocked_s3, s3_client):
+    s3_client.put_file(file_content="", bucket="dsc", key="test/batch-aaa/123/123.pdf")
+    s3_client.put_file(file_content="", bucket="dsc", key="test/batch-aaa/123/123.xml")
+    s3_client.put_file(file_content="", bucket="dsc", key="test/batch-aaa/456/456.pdf")
+    s3_client.put_file(file_content="", bucket="dsc", key="test/batch-aaa/metadata.csv")
+
+    assert list(s3_client.subfolders_iter(bucket="dsc", prefix="test/batch-aaa/")) == [
+        "test/batch-aaa/123/",
+        "test/batch-aaa/456/",
+    ]
+
+
 def test_s3_client_files_iter_success(mocked_s3, s3_client):
     s3_client.put_file(
         file_content="",
@@ -122,3 +141,16 @@ def test_s3_client_files_iter_with_exclude_prefixes_success(mocked_s3, s3_client
             exclude_prefixes=["archived", "workflow/batch-aaa/metadata.csv"],
         )
     ) == ["s3://dsc/workflow/batch-aaa/456.pdf"]
+
+
+def test_s3_client_files_iter_exclude_prefixes_matched_literally(mocked_s3, s3_client):
+    s3_client.put_file(file_content="", bucket="dsc", key="workflow/batch-aaa/1.pdf")
+    s3_client.put_file(file_content="", bucket="dsc", key="workflow/batch.aaa/2.pdf")
+
+    assert list(
+        s3_client.files_iter(
+            bucket="dsc",
+            prefix="workflow/",
+            exclude_prefixes=["batch.aaa/"],
+        )
+    ) == ["s3://dsc/workflow/batch-aaa/1.pdf"]
@@ -1,5 +1,6 @@
 import json
 from http import HTTPStatus
+from unittest.mock import patch
 
 import pytest
 from botocore.exceptions import ClientError
@@ -119,6 +120,44 @@ def test_sqs_delete_invalid_receipt_handle_raises_error(mocked_sqs_output, sqs_c
     )
 
 
+def test_sqs_delete_batch_success(
+    mocked_sqs_output,
+    sqs_client,
+    result_message_attributes,
+    result_message_body_success,
+):
+    for _ in range(2):
+        sqs_client.send(
+            message_attributes=result_message_attributes,
+            message_body=result_message_body_success,
+        )
+    messages = [
+        (message["MessageId"], message["ReceiptHandle"])
+        for message in sqs_client.receive()
+    ]
+    failed_message_ids = sqs_client.delete_batch(messages)
+
+    assert len(messages) == 2  # noqa: PLR2004
+    assert failed_message_ids == []
+    assert "Messages" not in mocked_sqs_output.receive_message(
+        QueueUrl=sqs_client.queue_url
+    )
+
+
+def test_sqs_delete_batch_invalid_receipt_handle_logs_error(
+    caplog, mocked_sqs_output, sqs_client
+):
+    failed_message_ids = sqs_client.delete_batch([("def", "abc")])
+
+    assert failed_message_ids == ["def"]
+    assert "Failed to delete message: def (ReceiptHandleIsInvalid" in caplog.text
+
+
+def test_sqs_delete_batch_too_many_messages_raises_error(sqs_client):
+    with pytest.raises(ValueError, match="Cannot delete more than 10 messages"):
+        sqs_client.delete_batch([("def", "abc")] * 11)
+
+
 def test_sqs_send_success(
     mocked_sqs_input,
     sqs_client,
@@ -152,6 +191,54 @@ def test_sqs_send_nonexistent_queue_raises_error(
     )
 
 
+def test_sqs_send_batch_success(
+    mocked_sqs_input,
+    sqs_client,
+    submission_message_attributes,
+    submission_message_body_for_create_operation,
+):
+    sqs_client.queue_name = "mock-input-queue"
+    sent_message_ids, failed_messages = sqs_client.send_batch(
+        [(submission_message_attributes, submission_message_body_for_create_operation)]
+        * 2
+    )
+
+    assert sorted(sent_message_ids) == [0, 1]
+    assert failed_messages == {}
+    assert len(list(sqs_client.receive())) == 2  # noqa: PLR2004
+
+
+def test_sqs_send_batch_splits_requests_by_size(
+    mocked_sqs_input,
+    sqs_client,
+    submission_message_attributes,
+):
+    sqs_client.queue_name = "mock-input-queue"
+    message_body = "a" * 100_000
+    with patch.object(
+        sqs_client.client,
+        "send_message_batch",
+        wraps=sqs_client.client.send_message_batch,
+    ) as mocked_method:
+        sent_message_ids, failed_messages = sqs_client.send_batch(
+            [(submission_message_attributes, message_body)] * 3
+        )
+
+    assert sorted(sent_message_ids) == [0, 1, 2]
+    assert failed_messages == {}
+    assert [len(call.kwargs["Entries"]) for call in mocked_method.call_args_list] == [
+        2,
+        1,
+    ]
+
+
+def test_sqs_send_batch_too_many_messages_raises_error(
+    sqs_client, submission_message_attributes
+):
+    with pytest.raises(ValueError, match="Cannot send more than 10 messages"):
+        sqs_client.send_batch([(submission_message_attributes, "{}")] * 11)
+
+
 def test_sqs_receive_success(
     mocked_sqs_output,
     sqs_client,
@@ -168,6 +255,24 @@ def test_sqs_receive_success(
         assert message["MessageAttributes"] == result_message_attributes
 
 
+def test_sqs_receive_with_wait_time_and_visibility_timeout_success(
+    mocked_sqs_output,
+    sqs_client,
+    result_message_attributes,
+    result_message_body_success,
+):
+    sqs_client.send(
+        message_attributes=result_message_attributes,
+        message_body=result_message_body_success,
+    )
+    messages = list(sqs_client.receive(wait_time_seconds=1, visibility_timeout=30))
+    assert len(messages) == 1
+    assert messages[0]["Body"] == str(result_message_body_success)
+
+    # received message remains hidden for the duration of the visibility timeout
+    assert list(sqs_client.receive()) == []
+
+
 def test_sqs_receive_nonexistent_queue_raises_error(mocked_sqs_output, sqs_client):
     sqs_client.queue_name = "nonexistent"
 
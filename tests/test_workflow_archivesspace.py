@@ -1,10 +1,12 @@
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 import smart_open
 from freezegun import freeze_time
 
 from dsc.db.models import ItemSubmissionDB, ItemSubmissionStatus
+from dsc.item_submission import ItemSubmission
 
 
 @freeze_time("2025-01-01 09:00:00")
@@ -114,3 +116,36 @@ def test_workflow_specific_processing_wrong_date_skipped(
         f"No items ingested for '{archivesspace_workflow_instance.batch_id}' on run "
         f"date '{run_date_str}'" in caplog.text
     )
+
+
+@freeze_time("2025-01-01 09:00:00")
+def test_workflow_specific_processing_uses_finalized_item_submissions(
+    archivesspace_workflow_instance,
+    mock_item_submission_db,
+    mocked_s3,
+    s3_client,
+):
+    run_date = datetime.now(UTC)
+    run_date_str = run_date.strftime("%Y-%m-%d-%H:%M:%S")
+
+    archivesspace_workflow_instance.finalized_item_submissions = [
+        ItemSubmission(
+            item_identifier="123",
+            batch_id="batch-aaa",
+            workflow_name="archivesspace",
+            dspace_handle="handle/123",
+            source_system_identifier="archives/456",
+            status=ItemSubmissionStatus.INGEST_SUCCESS,
+            last_run_date=run_date,
+        )
+    ]
+    s3_client.client.create_bucket(Bucket="output-bucket")
+
+    with patch.object(ItemSubmission, "get_batch") as mock_get_batch:
+        archivesspace_workflow_instance.workflow_specific_processing()
+
+    mock_get_batch.assert_not_called()
+    with smart_open.open(
+        f"s3://output-bucket/{archivesspace_workflow_instance.batch_id}-{run_date_str}.csv"
+    ) as csv_file:
+        assert csv_file.read() == "ao_uri,dspace_handle\narchives/456,handle/123\n"
@@ -1,16 +1,20 @@
+import dataclasses
 import json
 from datetime import UTC, datetime
 from unittest.mock import patch
 
 import pytest
-from botocore.exceptions import ClientError
 from freezegun import freeze_time
 
 from dsc.db.models import ItemSubmissionDB, ItemSubmissionStatus
 from dsc.exceptions import (
+    InvalidSQSMessageError,
     InvalidWorkflowNameError,
+    ItemSubmissionExistsError,
 )
+from dsc.item_submission import ItemSubmission
 from dsc.workflows.base import Workflow
+from dsc.workflows.base.workflow import DSSResultMessage, ItemMetadataReader
 
 
 def test_base_workflow_init_with_defaults_success():
@@ -27,6 +31,76 @@ def test_base_workflow_init_with_defaults_success():
     assert workflow_instance.output_queue == "mock-output-queue"
 
 
+def test_base_workflow_metadata_mapping_loaded_once(base_workflow_instance):
+    with patch("builtins.open", wraps=open) as mocked_open:
+        metadata_mapping = base_workflow_instance.metadata_mapping
+        assert base_workflow_instance.metadata_mapping is metadata_mapping
+    mocked_open.assert_called_once()
+
+
+def test_base_workflow_get_item_bitstream_uris_success(base_workflow_instance):
+    assert base_workflow_instance.get_item_bitstream_uris("123") == [
+        "s3://dsc/test/batch-aaa/123_01.pdf",
+        "s3://dsc/test/batch-aaa/123_02.pdf",
+    ]
+    assert base_workflow_instance.get_item_bitstream_uris("123_01.pdf") == [
+        "s3://dsc/test/batch-aaa/123_01.pdf"
+    ]
+
+
+def test_base_workflow_get_item_bitstream_uris_partial_identifier_not_matched(
+    base_workflow_instance,
+):
+    base_workflow_instance._batch_bitstream_uris = [  # noqa: SLF001
+        "s3://dsc/test/batch-aaa/12_01.pdf",
+        "s3://dsc/test/batch-aaa/123_01.pdf",
+    ]
+
+    assert base_workflow_instance.get_item_bitstream_uris("12") == [
+        "s3://dsc/test/batch-aaa/12_01.pdf"
+    ]
+    assert base_workflow_instance.get_item_bitstream_uris("456") == []
+
+
+def test_base_workflow_get_item_bitstream_uris_matches_identifier_boundaries_only(
+    base_workflow_instance,
+):
+    base_workflow_instance._batch_bitstream_uris = [  # noqa: SLF001
+        "s3://dsc/test/batch-aaa/123.pdf",
+        "s3://dsc/test/batch-aaa/123 (1).pdf",
+        "s3://dsc/test/batch-aaa/mit_123.pdf",
+        "s3://dsc/test/batch-aaa/1234.pdf",
+        "s3://dsc/test/batch-aaa/abc-1-2.pdf",
+    ]
+
+    assert base_workflow_instance.get_item_bitstream_uris("123") == [
+        "s3://dsc/test/batch-aaa/123.pdf"
+    ]
+    assert base_workflow_instance.get_item_bitstream_uris("12") == []
+    assert base_workflow_instance.get_item_bitstream_uris("abc-1") == []
+
+
+def test_item_metadata_reader_reads_lazily(base_workflow_instance):
+    item_metadata_reader = ItemMetadataReader(base_workflow_instance.item_metadata_iter())
+
+    assert item_metadata_reader.get("789")["title"] == "2nd Title"
+    assert list(item_metadata_reader.cache) == ["123"]
+    assert item_metadata_reader.get("123")["title"] == "Title"
+    assert item_metadata_reader.cache == {}
+    assert item_metadata_reader.get("456") is None
+
+
+def test_item_metadata_reader_caches_only_given_item_identifiers(
+    base_workflow_instance,
+):
+    item_metadata_reader = ItemMetadataReader(
+        base_workflow_instance.item_metadata_iter(), item_identifiers={"789"}
+    )
+
+    assert item_metadata_reader.get("789")["title"] == "2nd Title"
+    assert item_metadata_reader.cache == {}
+
+
 def test_base_workflow_get_workflow_success():
     workflow_class = Workflow.get_workflow("test")
     assert workflow_class.workflow_name == "test"
@@ -51,6 +125,21 @@ def test_base_workflow_create_batch_in_db_success(
     assert item_submission.status == ItemSubmissionStatus.CREATE_SUCCESS
 
 
+def test_base_workflow_create_batch_in_db_existing_record_raises_error(
+    caplog, base_workflow_instance, mock_item_submission_db
+):
+    ItemSubmissionDB(
+        item_identifier="123", batch_id="batch-aaa", workflow_name="test"
+    ).create()
+    item_submissions, _ = base_workflow_instance.prepare_batch()
+
+    with pytest.raises(ItemSubmissionExistsError):
+        base_workflow_instance._create_batch_in_db(item_submissions)  # noqa: SLF001
+
+    assert "Failed to create record for item submission '123'" in caplog.text
+    assert ItemSubmissionDB.get(hash_key="batch-aaa", range_key="789")
+
+
 def test_base_workflow_submit_items_success(
     caplog,
     base_workflow_instance,
@@ -84,6 +173,61 @@ def test_base_workflow_submit_items_success(
     assert json.dumps(expected_submission_summary) in caplog.text
 
 
+def test_base_workflow_submit_items_lists_batch_bitstreams_once(
+    monkeypatch,
+    base_workflow_instance,
+    mocked_s3,
+    mocked_sqs_input,
+    mocked_sqs_output,
+    mock_item_submission_db,
+):
+    monkeypatch.setenv("MAX_WORKERS", "3")
+    ItemSubmissionDB(
+        item_identifier="123",
+        batch_id="batch-aaa",
+        workflow_name="test",
+        status=ItemSubmissionStatus.CREATE_SUCCESS,
+    ).create()
+    ItemSubmissionDB(
+        item_identifier="789",
+        batch_id="batch-aaa",
+        workflow_name="test",
+        status=ItemSubmissionStatus.CREATE_SUCCESS,
+    ).create()
+    with patch.object(
+        type(base_workflow_instance),
+        "get_batch_bitstream_uris",
+        autospec=True,
+        side_effect=type(base_workflow_instance).get_batch_bitstream_uris,
+    ) as mocked_method:
+        items = base_workflow_instance.submit_items(collection_handle="123.4/5678")
+
+    assert len(items) == 2  # noqa: PLR2004
+    mocked_method.assert_called_once()
+
+
+def test_base_workflow_submit_items_none_ready_does_not_list_batch_bitstreams(
+    base_workflow_instance,
+    mocked_s3,
+    mocked_sqs_input,
+    mocked_sqs_output,
+    mock_item_submission_db,
+):
+    ItemSubmissionDB(
+        item_identifier="123",
+        batch_id="batch-aaa",
+        workflow_name="test",
+        status=ItemSubmissionStatus.INGEST_SUCCESS,
+    ).create()
+    with patch.object(
+        type(base_workflow_instance), "get_batch_bitstream_uris"
+    ) as mocked_method:
+        items = base_workflow_instance.submit_items(collection_handle="123.4/5678")
+
+    assert items == []
+    mocked_method.assert_not_called()
+
+
 def test_base_workflow_submit_items_no_collection_handle_raises_error(
     caplog,
     base_workflow_instance,
@@ -146,7 +290,7 @@ def test_base_workflow_submit_items_ready_to_submit_false_is_skipped(
     assert json.dumps(expected_submission_summary) in caplog.text
 
 
-@patch("dsc.item_submission.ItemSubmission.send_submission_message")
+@patch("dsc.utils.aws.sqs.SQSClient.send_batch")
 def test_base_workflow_submit_items_exceptions_handled(
     mocked_method,
     caplog,
@@ -156,19 +300,11 @@ def test_base_workflow_submit_items_exceptions_handled(
     mocked_sqs_output,
     mock_item_submission_db,
 ):
-    side_effect = [
-        {"MessageId": "abcd", "ResponseMetadata": {"HTTPStatusCode": 200}},
-        ClientError(
-            {
-                "Error": {
-                    "Code": "InvalidParameterValue",
-                    "Message": "The specified S3 bucket does not exist.",
-                }
-            },
-            "SendMessage",
-        ),
-    ]
-    mocked_method.side_effect = side_effect
+    # submission messages are sent in batches, so results are keyed by position
+    mocked_method.return_value = (
+        {0: "abcd"},
+        {1: "InvalidParameterValue: The specified S3 bucket does not exist."},
+    )
     ItemSubmissionDB(
         item_identifier="123",
         batch_id="batch-aaa",
@@ -190,6 +326,128 @@ def test_base_workflow_submit_items_exceptions_handled(
     assert json.dumps(expected_submission_summary) in caplog.text
 
 
+def test_base_workflow_submit_items_prepare_error_not_sent(
+    caplog,
+    base_workflow_instance,
+    mocked_s3,
+    mocked_sqs_input,
+    mocked_sqs_output,
+    mock_item_submission_db,
+):
+    ItemSubmissionDB(
+        item_identifier="123",
+        batch_id="batch-aaa",
+        workflow_name="test",
+        status=ItemSubmissionStatus.CREATE_SUCCESS,
+    ).create()
+    ItemSubmissionDB(
+        item_identifier="456",
+        batch_id="batch-aaa",
+        workflow_name="test",
+        status=ItemSubmissionStatus.CREATE_SUCCESS,
+    ).create()
+    items = base_workflow_instance.submit_items(collection_handle="123.4/5678")
+
+    expected_submission_summary = {"total": 2, "submitted": 1, "skipped": 0, "errors": 1}
+
+    assert [item["item_identifier"] for item in items] == ["123"]
+    assert json.dumps(expected_submission_summary) in caplog.text
+    assert ItemSubmissionDB.get(hash_key="batch-aaa", range_key="123").status == (
+        ItemSubmissionStatus.SUBMIT_SUCCESS
+    )
+    assert ItemSubmissionDB.get(hash_key="batch-aaa", range_key="456").status == (
+        ItemSubmissionStatus.SUBMIT_FAILED
+    )
+
+
+def test_base_workflow_submit_items_bounds_item_submissions_in_flight(
+    monkeypatch,
+    base_workflow_instance,
+    mocked_s3,
+    mocked_sqs_input,
+    mocked_sqs_output,
+    mock_item_submission_db,
+):
+    monkeypatch.setenv("MAX_WORKERS", "1")
+    item_identifiers = [f"{number:02}" for number in range(1, 31)]
+    for item_identifier in item_identifiers:
+        ItemSubmissionDB(
+            item_identifier=item_identifier,
+            batch_id="batch-aaa",
+            workflow_name="test",
+            status=ItemSubmissionStatus.CREATE_SUCCESS,
+        ).create()
+
+    read_item_identifiers = []
+
+    def item_metadata_iter():
+        for item_identifier in item_identifiers:
+            read_item_identifiers.append(item_identifier)
+            yield {"item_identifier": item_identifier, "title": "Title"}
+
+    read_counts_when_prepared = []
+    prepare_item_submission = base_workflow_instance._prepare_item_submission  # noqa: SLF001
+
+    def record_read_count(item_submission, *args, **kwargs):
+        read_counts_when_prepared.append(len(read_item_identifiers))
+        return prepare_item_submission(item_submission, *args, **kwargs)
+
+    with (
+        patch.object(base_workflow_instance, "item_metadata_iter", item_metadata_iter),
+        patch.object(
+            base_workflow_instance,
+            "_prepare_item_submission",
+            side_effect=record_read_count,
+        ),
+    ):
+        base_workflow_instance.submit_items(collection_handle="123.4/5678")
+
+    assert len(read_counts_when_prepared) == len(item_identifiers)
+    # with one worker, at most two groups of ten item submissions are in flight
+    assert all(
+        read_count <= prepared_count + 20
+        for prepared_count, read_count in enumerate(read_counts_when_prepared, start=1)
+    )
+
+
+def test_base_workflow_submit_items_metadata_error_does_not_submit_group(
+    base_workflow_instance,
+    mocked_s3,
+    mocked_sqs_input,
+    mocked_sqs_output,
+    mock_item_submission_db,
+):
+    ItemSubmissionDB(
+        item_identifier="123",
+        batch_id="batch-aaa",
+        workflow_name="test",
+        status=ItemSubmissionStatus.CREATE_SUCCESS,
+    ).create()
+    ItemSubmissionDB(
+        item_identifier="789",
+        batch_id="batch-aaa",
+        workflow_name="test",
+        status=ItemSubmissionStatus.CREATE_SUCCESS,
+    ).create()
+
+    def item_metadata_iter():
+        yield {"item_identifier": "123", "title": "Title"}
+        raise ValueError("Unable to read batch metadata")
+
+    with (
+        patch.object(base_workflow_instance, "item_metadata_iter", item_metadata_iter),
+        pytest.raises(ValueError, match="Unable to read batch metadata"),
+    ):
+        base_workflow_instance.submit_items(collection_handle="123.4/5678")
+
+    assert ItemSubmissionDB.get(hash_key="batch-aaa", range_key="123").status == (
+        ItemSubmissionStatus.CREATE_SUCCESS
+    )
+    assert ItemSubmissionDB.get(hash_key="batch-aaa", range_key="789").status == (
+        ItemSubmissionStatus.CREATE_SUCCESS
+    )
+
+
 def test_base_workflow_finalize_items_success(
     caplog,
     base_workflow_instance,
@@ -233,6 +491,7 @@ def test_base_workflow_finalize_items_success(
         "ingest_success": 1,
         "ingest_failed": 1,
         "ingest_unknown": 0,
+        "delete_failed": 0,
     }
 
     base_workflow_instance.finalize_items()
@@ -254,6 +513,114 @@ def test_base_workflow_finalize_items_success(
     assert record_2.ingest_attempts == 1
 
     assert json.dumps(expected_processing_summary) in caplog.text
+    assert "Messages" not in mocked_sqs_output.receive_message(
+        QueueUrl=sqs_client.queue_url
+    )
+
+
+@patch("dsc.utils.aws.sqs.SQSClient.delete_batch")
+def test_base_workflow_finalize_items_counts_failed_deletes(
+    mocked_method,
+    caplog,
+    base_workflow_instance,
+    mock_item_submission_db,
+    mocked_sqs_output,
+    result_message_attributes,
+    result_message_body_success,
+    sqs_client,
+):
+    mocked_method.return_value = ["abcd"]
+    ItemSubmissionDB(
+        item_identifier="10.1002/term.3131",
+        batch_id="batch-aaa",
+        workflow_name="test",
+        status=ItemSubmissionStatus.SUBMIT_SUCCESS,
+    ).create()
+    sqs_client.send(
+        message_attributes=result_message_attributes,
+        message_body=result_message_body_success,
+    )
+
+    base_workflow_instance.finalize_items()
+
+    assert '"delete_failed": 1' in caplog.text
+
+
+def test_base_workflow_finalize_items_error_saves_processed_items(
+    base_workflow_instance,
+    mock_item_submission_db,
+    mocked_sqs_output,
+    result_message_attributes,
+    result_message_body_success,
+    sqs_client,
+):
+    ItemSubmissionDB(
+        item_identifier="10.1002/term.3131",
+        batch_id="batch-aaa",
+        workflow_name="test",
+        status=ItemSubmissionStatus.SUBMIT_SUCCESS,
+    ).create()
+    sqs_client.send(
+        message_attributes=result_message_attributes,
+        message_body=result_message_body_success,
+    )
+
+    original_get_batch = ItemSubmission.get_batch
+
+    def get_batch(batch_id):
+        yield from original_get_batch(batch_id)
+        raise RuntimeError("Error reading batch")
+
+    with (
+        patch(
+            "dsc.workflows.base.workflow.ItemSubmission.get_batch",
+            side_effect=get_batch,
+        ),
+        pytest.raises(RuntimeError, match="Error reading batch"),
+    ):
+        base_workflow_instance.finalize_items()
+
+    record = ItemSubmissionDB.get("batch-aaa", "10.1002/term.3131")
+    assert record.status == ItemSubmissionStatus.INGEST_SUCCESS
+    assert "Messages" not in mocked_sqs_output.receive_message(
+        QueueUrl=sqs_client.queue_url
+    )
+
+
+def test_base_workflow_finalize_items_concurrently_drains_queue(
+    monkeypatch,
+    base_workflow_instance,
+    mock_item_submission_db,
+    mocked_sqs_output,
+    result_message_attributes,
+    result_message_body_success,
+    sqs_client,
+):
+    monkeypatch.setenv("MAX_WORKERS", "3")
+    item_identifiers = [f"10.1002/term.{index}" for index in range(25)]
+    for item_identifier in item_identifiers:
+        ItemSubmissionDB(
+            item_identifier=item_identifier,
+            batch_id="batch-aaa",
+            workflow_name="test",
+            status=ItemSubmissionStatus.SUBMIT_SUCCESS,
+        ).create()
+        result_message_attributes["PackageID"]["StringValue"] = item_identifier
+        sqs_client.send(
+            message_attributes=result_message_attributes,
+            message_body=result_message_body_success,
+        )
+
+    base_workflow_instance.finalize_items()
+
+    assert all(
+        ItemSubmissionDB.get("batch-aaa", item_identifier).status
+        == ItemSubmissionStatus.INGEST_SUCCESS
+        for item_identifier in item_identifiers
+    )
+    assert "Messages" not in mocked_sqs_output.receive_message(
+        QueueUrl=sqs_client.queue_url
+    )
 
 
 def test_base_workflow_finalize_items_already_ingested_item_skipped(
@@ -284,6 +651,7 @@ def test_base_workflow_finalize_items_already_ingested_item_skipped(
         "ingest_success": 0,
         "ingest_failed": 0,
         "ingest_unknown": 0,
+        "delete_failed": 0,
     }
 
     base_workflow_instance.finalize_items()
@@ -328,6 +696,7 @@ def test_base_workflow_finalize_items_missing_result_message_skipped(
         "ingest_success": 1,
         "ingest_failed": 0,
         "ingest_unknown": 0,
+        "delete_failed": 0,
     }
 
     base_workflow_instance.finalize_items()
@@ -342,6 +711,21 @@ def test_base_workflow_finalize_items_missing_result_message_skipped(
     assert record_2.ingest_attempts == 0
 
 
+def test_base_workflow_finalize_items_no_result_messages_skips_batch(
+    caplog,
+    base_workflow_instance,
+    mock_item_submission_db,
+    mocked_sqs_output,
+):
+    caplog.set_level("DEBUG")
+
+    with patch("dsc.workflows.base.workflow.ItemSubmission.get_batch") as get_batch:
+        base_workflow_instance.finalize_items()
+
+    get_batch.assert_not_called()
+    assert "No DSS result messages received" in caplog.text
+
+
 def test_base_workflow_finalize_items_with_unknown_ingest_result(
     caplog,
     base_workflow_instance,
@@ -379,6 +763,7 @@ def test_base_workflow_finalize_items_with_unknown_ingest_result(
         "ingest_success": 0,
         "ingest_failed": 0,
         "ingest_unknown": 1,
+        "delete_failed": 0,
     }
     assert json.dumps(expected_summary) in caplog.text
 
@@ -405,11 +790,52 @@ def test_base_workflow_finalize_items_exception_handled_and_logged(
         "ingest_success": 0,
         "ingest_failed": 0,
         "ingest_unknown": 0,
+        "delete_failed": 0,
     }
     assert "Failure parsing message" in caplog.text
     assert json.dumps(expected_summary) in caplog.text
 
 
+def test_dss_result_message_missing_message_attributes_raises_error(
+    result_message_body_success,
+):
+    with pytest.raises(InvalidSQSMessageError, match="Failed to parse result message"):
+        DSSResultMessage.from_result_message(
+            {
+                "MessageId": "abc",
+                "ReceiptHandle": "def",
+                "Body": result_message_body_success,
+            }
+        )
+
+
+def test_dss_result_message_invalid_body_json_raises_error(result_message_attributes):
+    with pytest.raises(InvalidSQSMessageError, match="Failed to parse result message"):
+        DSSResultMessage.from_result_message(
+            {
+                "MessageId": "abc",
+                "ReceiptHandle": "def",
+                "MessageAttributes": result_message_attributes,
+                "Body": "{not json",
+            }
+        )
+
+
+def test_dss_result_message_is_immutable(
+    result_message_attributes, result_message_body_success
+):
+    result_message = DSSResultMessage.from_result_message(
+        {
+            "MessageId": "abc",
+            "ReceiptHandle": "def",
+            "MessageAttributes": result_message_attributes,
+            "Body": result_message_body_success,
+        }
+    )
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result_message.result_type = "error"
+
+
 def test_base_workflow_workflow_specific_processing_success(
     caplog,
     base_workflow_instance,
@@ -228,10 +228,14 @@ def test_workflow_get_item_submissions_from_synced_batch_replacement_not_found(
     ]
 
 
-@patch("dsc.workflows.digitized_theses.workflow.S3Client.files_iter")
-def test_workflow_get_item_submissions_from_synced_batch_new(mock_s3client_files_iter):
-    mock_s3client_files_iter.return_value = [
-        "tests/fixtures/digitized-theses/batch-aaa/new-theses/05588126/05588126.xml"
+@patch(
+    "dsc.workflows.digitized_theses.workflow.DigitizedTheses._synced_batch_item_subfolders_iter"
+)
+def test_workflow_get_item_submissions_from_synced_batch_new(
+    mock_workflow_synced_batch_item_subfolders_iter,
+):
+    mock_workflow_synced_batch_item_subfolders_iter.return_value = [
+        ("new-theses", "05588126")
     ]
     workflow = DigitizedTheses(batch_id="batch-aaa")
     results = workflow._get_item_submissions_from_synced_batch()
@@ -249,12 +253,14 @@ def test_workflow_get_item_submissions_from_synced_batch_new(mock_s3client_files
     ]
 
 
-@patch("dsc.workflows.digitized_theses.workflow.S3Client.files_iter")
+@patch(
+    "dsc.workflows.digitized_theses.workflow.DigitizedTheses._synced_batch_item_subfolders_iter"
+)
 def test_workflow_get_item_submissions_from_synced_batch_skipped(
-    mock_s3client_files_iter,
+    mock_workflow_synced_batch_item_subfolders_iter,
 ):
-    mock_s3client_files_iter.return_value = [
-        "tests/fixtures/digitized-theses/batch-aaa/skipped-theses/05588126/05588126.xml"
+    mock_workflow_synced_batch_item_subfolders_iter.return_value = [
+        ("skipped-theses", "05588126")
     ]
     workflow = DigitizedTheses(batch_id="batch-aaa")
     results = workflow._get_item_submissions_from_synced_batch()
@@ -271,6 +277,61 @@ def test_workflow_get_item_submissions_from_synced_batch_skipped(
     ]
 
 
+def test_workflow_synced_batch_item_subfolders_iter(
+    caplog, mock_s3_digitized_theses_dsc, s3_client
+):
+    s3_client.put_file(
+        bucket="dsc",
+        key="digitized-theses/batch-aaa/new-theses/05588127/05588127.pdf",
+        file_content="",
+    )
+    s3_client.put_file(
+        bucket="dsc",
+        key="digitized-theses/batch-aaa/new-theses/notes/notes.txt",
+        file_content="",
+    )
+    s3_client.put_file(
+        bucket="dsc", key="digitized-theses/batch-aaa/other/notes.txt", file_content=""
+    )
+    workflow = DigitizedTheses(batch_id="batch-aaa")
+
+    assert list(workflow._synced_batch_item_subfolders_iter()) == [
+        ("new-theses", "05588127"),
+        ("replacement-theses", "05588126"),
+    ]
+    assert (
+        "Cannot create item submissions for subfolder: "
+        "digitized-theses/batch-aaa/new-theses/notes/" in caplog.text
+    )
+    assert (
+        "Cannot create item submissions for subfolder: "
+        "digitized-theses/batch-aaa/other/" in caplog.text
+    )
+    assert caplog.text.count("Cannot create item submissions for subfolder") == 2  # noqa: PLR2004
+
+
+def test_workflow_synced_batch_item_subfolders_iter_nested_theses_subfolders(
+    caplog, mock_s3_digitized_theses_dsc, s3_client
+):
+    s3_client.put_file(
+        bucket="dsc",
+        key="digitized-theses/batch-aaa/2025/new-theses/05588127/05588127.pdf",
+        file_content="",
+    )
+    s3_client.put_file(
+        bucket="dsc",
+        key="digitized-theses/batch-aaa/new-theses/extra/skipped-theses/05588128/a.pdf",
+        file_content="",
+    )
+    workflow = DigitizedTheses(batch_id="batch-aaa")
+
+    assert sorted(workflow._synced_batch_item_subfolders_iter()) == [
+        ("new-theses", "05588127"),
+        ("replacement-theses", "05588126"),
+        ("skipped-theses", "05588128"),
+    ]
+
+
 @patch("dsc.workflows.digitized_theses.workflow.requests")
 def test_workflow_download_metadata_from_alma(
     mock_requests, alma_sru_response_single_record, tmp_path